@@ -10,3 +10,5 @@ CLIENT = boto3.resource("dynamodb")
 APP = CLIENT.Table("app")
 RAFFLES = CLIENT.Table("raffles")
 ANALYTICS = CLIENT.Table("analytics")
+
+CONDITION_FAILED = CLIENT.meta.client.exceptions.ConditionalCheckFailedException
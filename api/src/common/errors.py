@@ -5,7 +5,8 @@ IDS = {
     "http": 2001,
     "whop": 2002,
     "webhook": 2003,
-    "unknown": 2004
+    "unknown": 2004,
+    "database": 2005
 }
 
 
@@ -24,3 +25,7 @@ class WhopError(Exception):
 
 class WebhookError(Exception):
     msg = DFLT_MSG.format(IDS["webhook"])
+
+
+class DatabaseError(Exception):
+    msg = DFLT_MSG.format(IDS["database"])
@@ -1,76 +1,149 @@
 # -*- coding: utf-8 -*-
 from flask import Blueprint, request, jsonify
 from common import database
+from common.errors import DatabaseError
 from common.security import auth_required
 
 
 blueprint = Blueprint("analytics", __name__, url_prefix="/analytics")
 
 
-def upload_analytics(user_id, site, product_name, entries, wins):
-    query = database.ANALYTICS.get_item(
-        Key={"userId": user_id}
-    )
+max_batch_size = 25
 
-    if item := query.get("Item"):
-        sites = item["sites"]
 
-        if site in sites:
-            site_data = sites[site]
+def upload_analytics(user_id, deltas):
+    raffles = {}
+    for site, product_name, entries, wins in deltas:
+        raffle = raffles.setdefault((site, product_name), [0, 0])
+        raffle[0] += entries
+        raffle[1] += wins
 
-            site_data["entries"] += entries
-            site_data["wins"] += wins
+    raffles = [
+        (site, product_name, entries, wins)
+        for (site, product_name), (entries, wins) in raffles.items()
+    ]
 
-            if product_name in site_data["raffles"]:
-                site_data["raffles"][product_name]["entries"] += entries
-                site_data["raffles"][product_name]["wins"] += wins
-            else:
-                site_data["raffles"][product_name] = {
-                    "entries": entries,
-                    "wins": wins
-                }
-        else:
-            site_data = {
-                "entries": entries,
-                "wins": wins,
-                "raffles": {
-                    product_name: {
-                        "entries": entries,
-                        "wins": wins
+    for index in range(0, len(raffles), max_batch_size):
+        update_analytics(user_id, raffles[index:index + max_batch_size])
+
+
+def update_analytics(user_id, raffles):
+    sites = {}
+    for site, product_name, entries, wins in raffles:
+        sites.setdefault(site, []).append((product_name, entries, wins))
+
+    names = {}
+    values = {
+        ":entries": sum(raffle[2] for raffle in raffles),
+        ":wins": sum(raffle[3] for raffle in raffles)
+    }
+    actions = ["totalEntries :entries", "totalWins :wins"]
+    conditions = []
+
+    for site_index, (site, site_raffles) in enumerate(sites.items()):
+        site_key = f"s{site_index}"
+
+        names[f"#{site_key}"] = site
+        values[f":{site_key}e"] = sum(raffle[1] for raffle in site_raffles)
+        values[f":{site_key}w"] = sum(raffle[2] for raffle in site_raffles)
+        actions += [
+            f"sites.#{site_key}.entries :{site_key}e",
+            f"sites.#{site_key}.wins :{site_key}w"
+        ]
+
+        for raffle_index, (product_name, entries, wins) in enumerate(site_raffles):
+            raffle_key = f"{site_key}p{raffle_index}"
+            path = f"sites.#{site_key}.raffles.#{raffle_key}"
+
+            names[f"#{raffle_key}"] = product_name
+            values[f":{raffle_key}e"] = entries
+            values[f":{raffle_key}w"] = wins
+            actions += [
+                f"{path}.entries :{raffle_key}e",
+                f"{path}.wins :{raffle_key}w"
+            ]
+            conditions.append(f"attribute_exists({path})")
+
+    for _ in range(3):
+        try:
+            database.ANALYTICS.update_item(
+                Key={"userId": user_id},
+                UpdateExpression="ADD " + ", ".join(actions),
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values
+            )
+            return
+        except database.CONDITION_FAILED:
+            create_analytics_maps(user_id, sites)
+
+    raise DatabaseError
+
+
+def create_analytics_maps(user_id, sites):
+    database.ANALYTICS.update_item(
+        Key={"userId": user_id},
+        UpdateExpression="SET sites = if_not_exists(sites, :empty)",
+        ExpressionAttributeValues={
+            ":empty": {}
+        }
+    )
+
+    for site, site_raffles in sites.items():
+        try:
+            database.ANALYTICS.update_item(
+                Key={"userId": user_id},
+                UpdateExpression="SET sites.#site = :data",
+                ConditionExpression="attribute_not_exists(sites.#site)",
+                ExpressionAttributeNames={
+                    "#site": site
+                },
+                ExpressionAttributeValues={
+                    ":data": {
+                        "entries": 0,
+                        "wins": 0,
+                        "raffles": {}
                     }
                 }
-            }
-
-        database.ANALYTICS.update_item(
-            Key={"userId": user_id},
-            UpdateExpression="ADD totalEntries :entries, totalWins :wins  SET sites.#site = :data",
-            ExpressionAttributeNames={
-                "#site": site
-            },
-            ExpressionAttributeValues={
-                ":entries": entries,
-                ":wins": wins,
-                ":data": site_data
-            }
-        )
-    else:
-        database.ANALYTICS.put_item(Item={
-            "userId": user_id,
-            "totalEntries": entries,
-            "totalWins": wins,
-            "sites": {
-                site: {
-                    "entries": entries,
-                    "wins": wins,
-                    "raffles": {
-                        product_name: {
-                            "entries": entries,
-                            "wins": wins
+            )
+        except database.CONDITION_FAILED:
+            pass
+
+        for product_name, _, _ in site_raffles:
+            try:
+                database.ANALYTICS.update_item(
+                    Key={"userId": user_id},
+                    UpdateExpression="SET sites.#site.raffles.#raffle = :data",
+                    ConditionExpression="attribute_not_exists(sites.#site.raffles.#raffle)",
+                    ExpressionAttributeNames={
+                        "#site": site,
+                        "#raffle": product_name
+                    },
+                    ExpressionAttributeValues={
+                        ":data": {
+                            "entries": 0,
+                            "wins": 0
                         }
                     }
-                }
-            }
-        })
+                )
+            except database.CONDITION_FAILED:
+                pass
+
+
+def parse_delta(delta):
+    site = delta["site"]
+    product_name = delta["productName"]
+
+    entries = delta.get("entries", 0)
+    wins = delta.get("wins", 0)
+    if not (
+        isinstance(site, str) and isinstance(product_name, str) and
+        isinstance(entries, int) and isinstance(wins, int) and
+        entries >= 0 and wins >= 0 and (entries or wins)
+    ):
+        raise ValueError
+
+    return site, product_name, entries, wins
 
 
 @blueprint.route("/<user_id>", methods=["POST"])
@@ -80,23 +153,56 @@ def analytics(user_id):
 
     try:
         user_id = int(user_id)
-        site = body["site"]
-        product_name = body["productName"]
+        delta = parse_delta(body)
+    except (ValueError, KeyError, TypeError):
+        return jsonify(
+            success=False,
+            message="Bad request"
+        ), 400
+
+    try:
+        upload_analytics(
+            user_id, [delta]
+        )
+
+        return jsonify(
+            success=True
+        ), 200
+    except DatabaseError as error:
+        return jsonify(
+            success=False,
+            message=error.msg
+        ), 500
+
 
-        entries = body.get("entries", 0)
-        wins = body.get("wins", 0)
-        if not (entries or wins):
+@blueprint.route("/<user_id>/batch", methods=["POST"])
+@auth_required
+def analytics_batch(user_id):
+    body = request.json
+
+    try:
+        user_id = int(user_id)
+        deltas = [
+            parse_delta(delta) for delta in body["deltas"]
+        ]
+        if not deltas:
             raise ValueError
-    except (ValueError, KeyError):
+    except (ValueError, KeyError, TypeError):
         return jsonify(
             success=False,
             message="Bad request"
         ), 400
 
-    upload_analytics(
-        user_id, site, product_name, entries, wins
-    )
+    try:
+        upload_analytics(
+            user_id, deltas
+        )
 
-    return jsonify(
-        success=True
-    ), 200
+        return jsonify(
+            success=True
+        ), 200
+    except DatabaseError as error:
+        return jsonify(
+            success=False,
+            message=error.msg
+        ), 500
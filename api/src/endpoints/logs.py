@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import json
+import gzip
 from datetime import datetime
 from flask import Blueprint, request, jsonify
 from common import http
@@ -43,7 +44,12 @@ def logs(user_id):
         user_id = int(user_id)
         category = body["category"]
         logfile = files["logfile"]
-    except (ValueError, KeyError):
+
+        if logfile.mimetype == "application/gzip":
+            content = gzip.decompress(logfile.read())
+        else:
+            content = logfile.read()
+    except (ValueError, KeyError, OSError, EOFError):
         return jsonify(
             success=False,
             message="Bad request"
@@ -51,7 +57,7 @@ def logs(user_id):
 
     try:
         upload_logs(
-            user_id, category, logfile.filename, logfile.read()
+            user_id, category, logfile.filename, content
         )
 
         return jsonify(
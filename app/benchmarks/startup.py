@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+import os
+import io
+import sys
+import json
+import time
+import ctypes
+import argparse
+import tempfile
+import traceback
+import statistics
+import subprocess
+from pathlib import Path
+
+
+SRC_PATH = Path(__file__).absolute().parent.parent / "src"
+LICENSE_KEY = "BENCHMARK-LICENSE-KEY"
+APP_PACKAGES = ["common", "components", "constants", "managers", "tasks", "main"]
+CLIENT_EXPORTS = ["execReq", "freeMemory", "createClient", "addCookie", "deleteCookie", "clearCookies"]
+PHASES = ["registry", "imports", "data", "hub", "auth", "boot", "total"]
+
+
+class ReachedMenu(Exception):
+    pass
+
+
+class StubFunction:
+    def __init__(self):
+        self.argtypes = None
+        self.restype = None
+
+    def __call__(self, *args):
+        return None
+
+
+class StubClient:
+    def __init__(self):
+        for name in CLIENT_EXPORTS:
+            setattr(self, name, StubFunction())
+
+
+def stub_client():
+    cdll = ctypes.CDLL
+
+    def load_library(name, *args, **kwargs):
+        if "http_client" in str(name):
+            return StubClient()
+
+        return cdll(name, *args, **kwargs)
+
+    ctypes.CDLL = load_library
+
+
+def stub_network():
+    import jwt
+    import urllib3
+    from constants import app
+    from constants.apis import WEB_JWT_KEY
+
+    def request(self, method, url, body=None, headers=None, **kwargs):
+        content = {
+            "success": True,
+            "data": {
+                "app": {
+                    "version": app.VERSION
+                },
+                "user": {
+                    "id": 0,
+                    "name": "Benchmark",
+                    "licenseKey": LICENSE_KEY,
+                    "analytics": {}
+                },
+                "raffles": {}
+            }
+        } if "/auth/" in url else {
+            "success": True
+        }
+
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(content).encode()),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": "Bearer " + jwt.encode(
+                    {"exp": int(time.time()) + 60}, WEB_JWT_KEY, algorithm="HS256"
+                )
+            },
+            status=200,
+            preload_content=kwargs.get("preload_content", True)
+        )
+
+    urllib3.PoolManager.request = request
+
+
+def timed(cls, name, phase, phases):
+    function = getattr(cls, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            phases[phase] = time.perf_counter() - start
+
+    setattr(cls, name, wrapper)
+
+
+def run_child(output_path, include_ui_delays):
+    try:
+        measure_startup(output_path, include_ui_delays)
+    except BaseException:
+        traceback.print_exc()
+        sys.stderr.flush()
+        os._exit(1)  # NOQA
+
+    sys.stdout.flush()
+    os._exit(0)  # NOQA
+
+
+def measure_startup(output_path, include_ui_delays):
+    start = time.perf_counter()
+    phases = {}
+
+    sys.path.insert(0, str(SRC_PATH))
+    stub_client()
+
+    phase_start = time.perf_counter()
+    import constants.modules
+    phases["registry"] = time.perf_counter() - phase_start
+
+    stub_network()
+
+    phase_start = time.perf_counter()
+    import main
+    from common import data, ui
+    from components import Auth, Boot, Hub
+    phases["imports"] = time.perf_counter() - phase_start
+
+    if not include_ui_delays:
+        init = ui.LoadingBar.__init__
+
+        def loading_bar(self, msg, short=False, min_duration=0):
+            init(self, msg, short=short)
+
+        ui.LoadingBar.__init__ = loading_bar
+
+    def main_menu(self):
+        raise ReachedMenu
+
+    if loaded := [name for name in data.LOADERS if name in vars(data)]:
+        raise RuntimeError(f"Data loaded before the data phase: {', '.join(loaded)}")
+
+    phase_start = time.perf_counter()
+    for name in ["COUNTRY_IDS", "USER_AGENTS", "FIRST_NAMES", "LAST_NAMES"]:
+        getattr(data, name)
+    phases["data"] = time.perf_counter() - phase_start
+
+    timed(Hub, "__init__", "hub", phases)
+    timed(Auth, "__init__", "auth", phases)
+    timed(Boot, "__init__", "boot", phases)
+    Hub.main_menu = main_menu
+
+    try:
+        main.main()
+    except ReachedMenu:
+        phases["total"] = time.perf_counter() - start - phases["data"]
+
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.write(json.dumps(phases))
+
+
+def parse_importtime(output):
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        imports.append((
+            name.strip(), (len(name) - len(name.lstrip()) - 1) // 2,
+            int(self_time) / 1e6, int(cumulative_time) / 1e6
+        ))
+
+    return imports
+
+
+def run(include_ui_delays):
+    with tempfile.TemporaryDirectory() as temp_path:
+        temp_path = Path(temp_path)
+        output_path = temp_path / "phases.json"
+
+        with open(temp_path / "settings.json", "w", encoding="utf-8") as file:
+            file.write(json.dumps({"license-key": LICENSE_KEY}))
+
+        process = subprocess.run(
+            [
+                sys.executable, "-X", "importtime", str(Path(__file__).absolute()),
+                "--child", str(output_path)
+            ] + (["--include-ui-delays"] if include_ui_delays else []),
+            cwd=temp_path,
+            env=os.environ | {"HOME": str(temp_path), "USERPROFILE": str(temp_path)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if not output_path.is_file():
+            print(process.stderr[-4000:])
+            raise SystemExit("Startup did not reach the main menu")
+
+        with open(output_path, encoding="utf-8") as file:
+            return json.load(file), parse_importtime(process.stderr)
+
+
+def parse_budgets(parser, args):
+    budgets = {}
+    if args.budget is not None:
+        budgets["total"] = args.budget
+
+    for value in args.phase_budget:
+        try:
+            phase, seconds = value.split("=")
+            budgets[phase] = float(seconds)
+        except ValueError:
+            parser.error(f"invalid phase budget: {value!r}, expected PHASE=SECONDS")
+
+        if phase not in PHASES:
+            parser.error(f"unknown phase: {phase!r}, choose from {', '.join(PHASES)}")
+
+    return budgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the time it takes to reach the main menu")
+    parser.add_argument("--budget", type=float, help="maximum total startup time in seconds")
+    parser.add_argument("--phase-budget", action="append", default=[], metavar="PHASE=SECONDS",
+                        help="maximum time for a single phase (" + ", ".join(PHASES[:-1]) + ")")
+    parser.add_argument("--runs", type=int, default=3, help="number of runs, the median is reported")
+    parser.add_argument("--imports", type=int, default=15, help="number of slowest imports to list")
+    parser.add_argument("--include-ui-delays", action="store_true", help="keep loading bar minimum durations")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.include_ui_delays)
+
+    budgets = parse_budgets(parser, args)
+
+    runs = []
+    for _ in range(args.runs):
+        phases, imports = run(args.include_ui_delays)
+        runs.append(phases)
+
+    phases = {
+        phase: statistics.median(result[phase] for result in runs)
+        for phase in runs[0]
+    }
+
+    print("Phases (median of %d runs)" % args.runs)
+    for phase, seconds in phases.items():
+        budget = f" / {budgets[phase]:.3f}s" if phase in budgets else ""
+        print(f"  {phase:<10} {seconds:8.3f}s{budget}")
+
+    print("\nApp packages (cumulative import time)")
+    for name, depth, self_time, cumulative_time in imports:
+        if depth == 0 and name.split(".")[0] in APP_PACKAGES:
+            print(f"  {name:<40} {cumulative_time:8.3f}s")
+
+    print("\nSlowest imports (self time)")
+    for name, depth, self_time, cumulative_time in sorted(imports, key=lambda x: x[2], reverse=True)[:args.imports]:
+        print(f"  {name:<40} {self_time:8.3f}s  {cumulative_time:8.3f}s cumulative")
+
+    exceeded = [
+        phase for phase, seconds in budgets.items()
+        if phases.get(phase, 0) > seconds
+    ]
+    if exceeded:
+        print("\nBudget exceeded: " + ", ".join(
+            f"{phase} {phases[phase]:.3f}s > {budgets[phase]:.3f}s" for phase in exceeded
+        ))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,2 @@
 # -*- coding: utf-8 -*-
-from . import http, ui, data, errors, security, utils
+from . import bridge, http, ui, data, database, errors, security, utils
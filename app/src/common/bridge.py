@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from greenlet import greenlet, getcurrent
+
+
+class Bridge(greenlet):
+    pass
+
+
+def is_bridged():
+    return isinstance(getcurrent(), Bridge)
+
+
+def wait(awaitable):
+    return getcurrent().parent.switch(awaitable)
+
+
+def sleep(duration):
+    if is_bridged():
+        wait(asyncio.sleep(duration))
+    else:
+        time.sleep(duration)
+
+
+def call(function, *args, **kwargs):
+    if is_bridged():
+        return wait(asyncio.get_running_loop().run_in_executor(
+            None, partial(function, *args, **kwargs)
+        ))
+    else:
+        return function(*args, **kwargs)
+
+
+async def spawn(function, *args):
+    task = Bridge(function, getcurrent())
+
+    result = task.switch(*args)
+    while not task.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = task.throw(*sys.exc_info())
+        else:
+            result = task.switch(value)
+
+    return result
+
+
+def run(function, amount, max_workers):
+    async def main():
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=max_workers)
+        )
+
+        await asyncio.gather(*(
+            spawn(function) for _ in range(amount)
+        ))
+
+    asyncio.run(main())
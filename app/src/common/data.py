@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
+import sys
 import json
+import threading
 from constants.env import FILE_ENCODING, DEPS_PATH, SETTINGS_FIELDS
 
 
@@ -13,30 +15,72 @@ SITE_FILES = {}
 TOOL_FILES = {}
 PROXY_FILES = []
 
-with open(DEPS_PATH / "countries.json", encoding=FILE_ENCODING) as file:
-    content = json.load(file)
+data_lock = threading.Lock()
 
-    COUNTRY_IDS = {
-        country["convertedName"]: country["id"]
-        for country in content
-    }
-    COUNTRY_DATA = {
-        country["id"]: country
-        for country in content
-    }
-    PHONE_DATA = {
-        country["phone"]["prefix"]: country["phone"]
-        for country in content
+
+def load_countries():
+    with open(DEPS_PATH / "countries.json", encoding=FILE_ENCODING) as file:
+        content = json.load(file)
+
+    return {
+        "COUNTRY_IDS": {
+            sys.intern(country["convertedName"]): sys.intern(country["id"])
+            for country in content
+        },
+        "COUNTRY_DATA": {
+            sys.intern(country["id"]): country
+            for country in content
+        },
+        "PHONE_DATA": {
+            sys.intern(country["phone"]["prefix"]): country["phone"]
+            for country in content
+        }
     }
 
-with open(DEPS_PATH / "user_agents.json", encoding=FILE_ENCODING) as file:
-    USER_AGENTS = json.load(file)
 
-with open(DEPS_PATH / "first_names.csv", encoding=FILE_ENCODING) as file:
-    FIRST_NAMES = [
-        line.split(",")
-        for line in file.read().splitlines()
-    ]
+def load_user_agents():
+    with open(DEPS_PATH / "user_agents.json", encoding=FILE_ENCODING) as file:
+        return {
+            "USER_AGENTS": {
+                sys.intern(platform): tuple(user_agents)
+                for platform, user_agents in json.load(file).items()
+            }
+        }
+
+
+def load_first_names():
+    with open(DEPS_PATH / "first_names.csv", encoding=FILE_ENCODING) as file:
+        return {
+            "FIRST_NAMES": tuple(
+                tuple(sys.intern(value) for value in line.split(","))
+                for line in file.read().splitlines()
+            )
+        }
+
+
+def load_last_names():
+    with open(DEPS_PATH / "last_names.txt", encoding=FILE_ENCODING) as file:
+        return {
+            "LAST_NAMES": tuple(file.read().splitlines())
+        }
+
+
+LOADERS = {
+    "COUNTRY_IDS": load_countries,
+    "COUNTRY_DATA": load_countries,
+    "PHONE_DATA": load_countries,
+    "USER_AGENTS": load_user_agents,
+    "FIRST_NAMES": load_first_names,
+    "LAST_NAMES": load_last_names
+}
+
+
+def __getattr__(name):
+    if name in LOADERS:
+        with data_lock:
+            if name not in globals():
+                globals().update(LOADERS[name]())
+
+        return globals()[name]
 
-with open(DEPS_PATH / "last_names.txt", encoding=FILE_ENCODING) as file:
-    LAST_NAMES = file.read().splitlines()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
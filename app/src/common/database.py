@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import threading
+
+
+class Database:
+    def __init__(self, file_path, schema):
+        self.file_path = file_path
+        self.schema = schema
+
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def connect(self):
+        if not self.connection:
+            self.connection = sqlite3.connect(
+                self.file_path, check_same_thread=False, isolation_level=None
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(self.schema)
+
+        return self.connection
+
+    def execute(self, query, params=()):
+        with self.lock:
+            return self.connect().execute(query, params).rowcount
+
+    def execute_many(self, query, params):
+        with self.lock:
+            connection = self.connect()
+
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(query, params)
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+
+    def fetch_all(self, query, params=()):
+        with self.lock:
+            return self.connect().execute(query, params).fetchall()
+
+    def compact(self):
+        with self.lock:
+            self.connect().execute("VACUUM")
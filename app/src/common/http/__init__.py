@@ -1,13 +1,8 @@
 # -*- coding: utf-8 -*-
 from .session import Session
-from . import classes, client, constants
+from .pool import PoolSession
+from .metrics import METRICS
+from . import cassette, classes, client, codecs, constants, metrics
 
 
-SESSION = Session(in_hub=True)
-
-get = SESSION.get
-post = SESSION.post
-head = SESSION.head
-patch = SESSION.patch
-put = SESSION.put
-delete = SESSION.delete
+POOL = PoolSession(in_hub=True)
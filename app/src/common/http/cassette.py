@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import json
+import base64
+import random
+import threading
+from collections import deque
+from urllib.parse import urlparse
+from constants.env import FILE_ENCODING, CASSETTE_MODE, CASSETTE_PATH, CASSETTE_LATENCY
+from common.utils import sleep
+
+
+class Cassette:
+    def __init__(self, file_path, mode, latency="0"):
+        self.file_path = file_path
+        self.mode = mode
+        self.latency = [float(value) for value in latency.split("-")]
+
+        self.lock = threading.Lock()
+        self.file = None
+        self.interactions = None
+
+    @property
+    def is_recording(self):
+        return self.mode == "record"
+
+    @property
+    def is_replaying(self):
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(request):
+        url = urlparse(request["url"])
+
+        return f"{request['method']} {url.netloc}{url.path}"
+
+    @staticmethod
+    def encode(response):
+        response = response.copy()
+        if isinstance(response.get("Body"), bytes):
+            response["Body"] = base64.b64encode(response["Body"]).decode()
+            response["IsRawBody"] = True
+
+        return response
+
+    @staticmethod
+    def decode(response):
+        response = response.copy()
+        if response.pop("IsRawBody", False):
+            response["Body"] = base64.b64decode(response["Body"])
+
+        return response
+
+    def load(self):
+        self.interactions = {}
+
+        try:
+            with open(self.file_path, encoding=FILE_ENCODING) as file:
+                for line in file:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self.interactions.setdefault(
+                            interaction["key"], deque()
+                        ).append(interaction["response"])
+        except (FileNotFoundError, PermissionError):
+            pass
+
+    def record(self, request, response):
+        line = json.dumps({
+            "key": self.key(request),
+            "request": {
+                "method": request["method"],
+                "url": request["url"]
+            },
+            "response": self.encode(response)
+        }, ensure_ascii=False)
+
+        with self.lock:
+            if not self.file:
+                self.file = open(self.file_path, "a", encoding=FILE_ENCODING)
+
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def replay(self, request):
+        with self.lock:
+            if self.interactions is None:
+                self.load()
+
+            responses = self.interactions.get(self.key(request))
+            if not responses:
+                response = None
+            elif len(responses) > 1:
+                response = responses.popleft()
+            else:
+                response = responses[0]
+
+        sleep(random.uniform(self.latency[0], self.latency[-1]))
+
+        if not response:
+            return {
+                "Status": 0,
+                "Url": request["url"],
+                "Body": "",
+                "Headers": {},
+                "Cookies": []
+            }
+
+        return self.decode(response)
+
+
+CASSETTE = Cassette(CASSETTE_PATH, CASSETTE_MODE, CASSETTE_LATENCY)
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 import json
 import random
-from common.data import USER_AGENTS
+from common import data
 from tasks.common.classes import CaseInsensitiveDict
 from .client import CLIENT
 from .constants import CHROME_VERSION, CHROME_CLIENT_HINT, ACCEPT_LANGUAGE, STATUS_CODE_REASONS
 
 
 class Request:
+    __slots__ = ("method", "url", "body", "headers")
+
     def __init__(self, request):
         self.method = request["method"]
         self.url = request["url"]
@@ -20,21 +22,55 @@ class Request:
 
 
 class Response:
-    def __init__(self, response, request):
+    __slots__ = (
+        "status", "ok", "url", "body",
+        "raw_headers", "raw_cookies", "raw_request", "raw_request_body",
+        "cached_headers", "cached_cookies", "cached_request", "cached_json"
+    )
+
+    def __init__(self, response, request, request_body=None):
         self.status = response["Status"]
-        self.reason = STATUS_CODE_REASONS[self.status]
         self.ok = self.status < 400
 
         self.url = response["Url"]
-        if response.get("RawBody"):
-            self.body = bytes(response["RawBody"])
-        else:
-            self.body = response["Body"]
+        self.body = response["Body"]
+
+        self.raw_headers = response["Headers"]
+        self.raw_cookies = response["Cookies"]
+        self.raw_request = request
+        self.raw_request_body = request_body
+
+        self.cached_headers = None
+        self.cached_cookies = None
+        self.cached_request = None
+        self.cached_json = None
+
+    @property
+    def reason(self):
+        return STATUS_CODE_REASONS.get(self.status, "")
+
+    @property
+    def headers(self):
+        if self.cached_headers is None:
+            self.cached_headers = CaseInsensitiveDict(self.raw_headers or {})
+
+        return self.cached_headers
 
-        self.headers = CaseInsensitiveDict(response["Headers"])
-        self.cookies = self.format_cookies(response["Cookies"])
+    @property
+    def cookies(self):
+        if self.cached_cookies is None:
+            self.cached_cookies = self.format_cookies(self.raw_cookies or [])
 
-        self.request = request
+        return self.cached_cookies
+
+    @property
+    def request(self):
+        if self.cached_request is None:
+            self.cached_request = Request(
+                self.raw_request | {"body": self.raw_request_body or {}}
+            )
+
+        return self.cached_request
 
     @staticmethod
     def format_cookies(cookies):
@@ -43,7 +79,10 @@ class Response:
         }
 
     def json(self):
-        return json.loads(self.body)
+        if self.cached_json is None:
+            self.cached_json = json.loads(self.body)
+
+        return self.cached_json
 
 
 class Headers:
@@ -51,7 +90,7 @@ class Headers:
         if client == "ios":
             self.user_agent = (
                 user_agent or
-                random.choice(USER_AGENTS["ios"])
+                random.choice(data.USER_AGENTS["ios"])
             )
 
             self.client_hint = None
@@ -60,7 +99,7 @@ class Headers:
         else:
             self.user_agent = (
                 user_agent or
-                random.choice(USER_AGENTS["windows"]).format(
+                random.choice(data.USER_AGENTS["windows"]).format(
                     version=CHROME_VERSION
                 )
             )
@@ -71,43 +110,73 @@ class Headers:
 
 
 class Cookies:
+    max_age = 31536000
+
     def __init__(self, session_uuid):
         self.session_uuid = session_uuid
 
         self.jar = {}
+        self.index = {}
 
     def get(self, name, domain=None, alt=None):
-        if domain:
-            try:
-                return self.jar[domain][name]
-            except KeyError:
-                return alt
-        else:
-            for domain in self.jar:
-                if name in self.jar[domain]:
-                    return self.jar[domain][name]
-            else:
-                return alt
+        if not domain:
+            domain = self.index.get(name)
 
-    def set(self, name, value, domain):
-        if domain not in self.jar:
-            self.jar[domain] = {}
+        try:
+            return self.jar[domain][name]
+        except KeyError:
+            return alt
 
-        self.jar[domain][name] = value
+    def set(self, name, value, domain):
+        self.set_local(name, value, domain)
 
         CLIENT.addCookie(json.dumps({
             "name": name,
             "value": value,
             "url": "https://" + domain,
-            "maxAge": 31536000,
+            "maxAge": self.max_age,
             "uuid": self.session_uuid
         }).encode())
 
+    def set_many(self, cookies, domain=None):
+        if domain:
+            cookies = {domain: cookies}
+
+        for domain, values in cookies.items():
+            for name, value in values.items():
+                self.set_local(name, value, domain)
+
+        cookies = [
+            {
+                "name": name,
+                "value": value,
+                "url": "https://" + domain,
+                "maxAge": self.max_age,
+                "uuid": self.session_uuid
+            } for domain, values in cookies.items() for name, value in values.items()
+        ]
+
+        if hasattr(CLIENT, "addCookies"):
+            CLIENT.addCookies(json.dumps({
+                "uuid": self.session_uuid,
+                "cookies": cookies
+            }).encode())
+        else:
+            for cookie in cookies:
+                CLIENT.addCookie(json.dumps(cookie).encode())
+
     def set_local(self, name, value, domain):
         if domain not in self.jar:
             self.jar[domain] = {}
 
         self.jar[domain][name] = value
+        self.index[name] = domain
+
+    def export(self):
+        return {
+            domain: values.copy()
+            for domain, values in self.jar.items() if values
+        }
 
     def delete(self, name, domain):
         try:
@@ -115,6 +184,14 @@ class Cookies:
         except KeyError:
             pass
 
+        if self.index.get(name) == domain:
+            del self.index[name]
+
+            for cookie_domain, values in self.jar.items():
+                if name in values:
+                    self.index[name] = cookie_domain
+                    break
+
         CLIENT.deleteCookie(json.dumps({
             "name": name,
             "url": "https://" + domain,
@@ -123,5 +200,6 @@ class Cookies:
 
     def clear(self):
         self.jar = {}
+        self.index = {}
 
         CLIENT.clearCookies(self.session_uuid.encode())
@@ -14,3 +14,18 @@ CLIENT.createClient.argtypes = [ctypes.c_char_p]
 CLIENT.addCookie.argtypes = [ctypes.c_char_p]
 CLIENT.deleteCookie.argtypes = [ctypes.c_char_p]
 CLIENT.clearCookies.argtypes = [ctypes.c_char_p]
+
+if hasattr(CLIENT, "updateClient"):
+    CLIENT.updateClient.argtypes = [ctypes.c_char_p]
+
+if hasattr(CLIENT, "addCookies"):
+    CLIENT.addCookies.argtypes = [ctypes.c_char_p]
+
+if hasattr(CLIENT, "execReqFrame"):
+    CLIENT.execReqFrame.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+    CLIENT.execReqFrame.restype = ctypes.POINTER(ctypes.c_char)
+
+BATCH_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.POINTER(ctypes.c_char))
+
+if hasattr(CLIENT, "execBatch"):
+    CLIENT.execBatch.argtypes = [ctypes.c_char_p, BATCH_CALLBACK]
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import json
+import ctypes
+import struct
+from time import perf_counter
+from common import bridge
+from .client import CLIENT, BATCH_CALLBACK
+
+
+class JSONCodec:
+    @staticmethod
+    def execute(request, timings=None):
+        timings = {} if timings is None else timings
+
+        start = perf_counter()
+        encoded_request = json.dumps(request).encode()
+        timings["encode"] = timings.get("encode", 0) + perf_counter() - start
+
+        start = perf_counter()
+        raw_response = bridge.call(CLIENT.execReq, encoded_request)
+        timings["network"] = perf_counter() - start
+
+        start = perf_counter()
+        response = json.loads(
+            ctypes.c_char_p.from_buffer(raw_response).value
+        )
+        CLIENT.freeMemory(raw_response)
+
+        if response.get("RawBody"):
+            response["Body"] = bytes(response.pop("RawBody"))
+        timings["decode"] = timings.get("decode", 0) + perf_counter() - start
+
+        return response
+
+
+class FrameCodec:
+    header = struct.Struct("<I")
+
+    @staticmethod
+    def encode(request):
+        body = request["body"]
+        if isinstance(body, str):
+            body = body.encode()
+
+        meta = json.dumps(
+            {key: value for key, value in request.items() if key != "body"}
+        ).encode()
+
+        return FrameCodec.header.pack(len(meta)) + meta + body
+
+    @staticmethod
+    def decode(address, length, is_raw):
+        meta_length = FrameCodec.header.unpack(
+            ctypes.string_at(address, FrameCodec.header.size)
+        )[0]
+        offset = FrameCodec.header.size + meta_length
+
+        response = json.loads(
+            ctypes.string_at(address + FrameCodec.header.size, meta_length)
+        )
+        body = ctypes.string_at(address + offset, length - offset)
+        response["Body"] = body if is_raw else body.decode(errors="replace")
+
+        return response
+
+    @staticmethod
+    def execute(request, timings=None):
+        timings = {} if timings is None else timings
+
+        start = perf_counter()
+        frame = FrameCodec.encode(request)
+        length = ctypes.c_size_t()
+        timings["encode"] = timings.get("encode", 0) + perf_counter() - start
+
+        start = perf_counter()
+        raw_response = bridge.call(
+            CLIENT.execReqFrame, frame, len(frame), ctypes.byref(length)
+        )
+        timings["network"] = perf_counter() - start
+
+        start = perf_counter()
+        try:
+            return FrameCodec.decode(
+                ctypes.cast(raw_response, ctypes.c_void_p).value,
+                length.value, request["sendRawBody"]
+            )
+        finally:
+            CLIENT.freeMemory(raw_response)
+            timings["decode"] = timings.get("decode", 0) + perf_counter() - start
+
+
+def execute_batch(requests, on_response):
+    def callback(index, raw_response):
+        response = json.loads(ctypes.string_at(raw_response))
+        CLIENT.freeMemory(raw_response)
+
+        if response.get("RawBody"):
+            response["Body"] = bytes(response.pop("RawBody"))
+
+        on_response(index, response)
+
+    CLIENT.execBatch(
+        json.dumps(requests).encode(), BATCH_CALLBACK(callback)
+    )
+
+
+CODEC = FrameCodec if hasattr(CLIENT, "execReqFrame") else JSONCodec
+IS_BATCH_SUPPORTED = hasattr(CLIENT, "execBatch")
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import json
+import math
+import threading
+from collections import Counter
+from constants.env import FILE_ENCODING
+from common.utils import extract_domain
+
+
+class Metrics:
+    bucket_factor = 1.1
+    percentiles = [50, 95, 99]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+        self.domains = {}
+        self.hooks = []
+
+    def add_hook(self, function):
+        self.hooks.append(function)
+
+    def remove_hook(self, function):
+        try:
+            self.hooks.remove(function)
+        except ValueError:
+            pass
+
+    def reset(self):
+        with self.lock:
+            self.domains = {}
+
+    def bucket(self, duration):
+        return math.ceil(math.log(max(duration * 1000, 1), self.bucket_factor))
+
+    def record(self, method, url, status, timings):
+        domain = extract_domain(url)
+        duration = sum(timings.values())
+        outcome = (
+            "error" if status in [0, 999] else
+            "success" if status < 400 else
+            "failure"
+        )
+
+        with self.lock:
+            metrics = self.domains.setdefault(domain, {
+                "requests": 0,
+                "statuses": Counter(),
+                "outcomes": Counter(),
+                "timings": Counter(),
+                "latency": Counter()
+            })
+
+            metrics["requests"] += 1
+            metrics["statuses"][status] += 1
+            metrics["outcomes"][outcome] += 1
+            metrics["timings"].update(timings)
+            metrics["latency"][self.bucket(duration)] += 1
+
+        for function in self.hooks:
+            try:
+                function({
+                    "method": method,
+                    "url": url,
+                    "domain": domain,
+                    "status": status,
+                    "outcome": outcome,
+                    "duration": duration,
+                    "timings": timings
+                })
+            except Exception:
+                continue
+
+    def percentile(self, latency, percentile):
+        target = sum(latency.values()) * percentile / 100
+
+        count = 0
+        for bucket in sorted(latency):
+            count += latency[bucket]
+            if count >= target:
+                return round(self.bucket_factor ** bucket, 1)
+
+        return 0
+
+    def summary(self):
+        with self.lock:
+            return {
+                domain: {
+                    "requests": metrics["requests"],
+                    "statuses": dict(metrics["statuses"]),
+                    "outcomes": dict(metrics["outcomes"]),
+                    "timings": {
+                        key: round(value / metrics["requests"] * 1000, 2)
+                        for key, value in metrics["timings"].items()
+                    },
+                    "latency": {
+                        f"p{percentile}": self.percentile(metrics["latency"], percentile)
+                        for percentile in self.percentiles
+                    }
+                } for domain, metrics in sorted(
+                    self.domains.items(), key=lambda x: x[1]["requests"], reverse=True
+                )
+            }
+
+    def dump(self, file_path):
+        if summary := self.summary():
+            try:
+                with open(file_path, "w", encoding=FILE_ENCODING) as file:
+                    file.write(json.dumps(
+                        summary, indent=4
+                    ))
+            except (FileNotFoundError, PermissionError):
+                pass
+
+
+METRICS = Metrics()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import certifi
+import urllib3
+from urllib.parse import urlencode, urljoin
+from common import bridge
+from common.errors import HTTPError as HubHTTPError
+from tasks.common.errors import HTTPError as TaskHTTPError
+from .classes import Response
+from .session import BaseSession
+
+
+class PoolSession(BaseSession):
+    pool = urllib3.PoolManager(
+        num_pools=16, maxsize=16, block=False, retries=False,
+        cert_reqs="CERT_REQUIRED", ca_certs=certifi.where()
+    )
+
+    def __init__(self, timeout=30, **kwargs):
+        self.timeout = timeout
+
+        if kwargs.get("in_hub"):
+            self.http_error = HubHTTPError
+        else:
+            self.http_error = TaskHTTPError
+
+    @staticmethod
+    def format_headers(headers):
+        return {
+            key: value for key, value in headers.items()
+            if value is not None
+        }
+
+    def request(self, method, url, params=None, body=None, headers=None, **kwargs):
+        body = body or {}
+        headers = self.format_headers(headers or {})
+
+        if params:
+            url += f"?{urlencode(params)}"
+
+        if body:
+            content_type_name = (
+                "Content-Type" if "Content-Type" in headers else "content-type"
+            )
+
+            encoded_body, headers[content_type_name] = self.format_body(
+                body, headers[content_type_name].split(";")[0]
+            )
+        else:
+            encoded_body = None
+
+        if hasattr(encoded_body, "read"):
+            headers["content-length"] = str(encoded_body.seek(0, 2))
+            encoded_body.seek(0)
+
+        try:
+            response = bridge.call(
+                self.pool.request, method, url,
+                body=encoded_body.encode() if isinstance(encoded_body, str) else encoded_body,
+                headers=headers,
+                redirect=kwargs.get("allow_redirects", True),
+                retries=urllib3.Retry(
+                    total=None, connect=0, read=0,
+                    redirect=10 if kwargs.get("allow_redirects", True) else False,
+                    raise_on_redirect=False
+                ),
+                timeout=self.timeout,
+                preload_content=not kwargs.get("discard_response")
+            )
+
+            if kwargs.get("discard_response"):
+                response.drain_conn()
+                response.release_conn()
+
+                return response.status
+        except urllib3.exceptions.HTTPError:
+            raise self.http_error
+        finally:
+            if hasattr(encoded_body, "close"):
+                encoded_body.close()
+
+        return Response(
+            {
+                "Status": response.status,
+                "Url": urljoin(url, response.geturl() or url),
+                "Body": response.data if kwargs.get("return_bytes") else response.data.decode(errors="replace"),
+                "Headers": dict(response.headers),
+                "Cookies": []
+            },
+            {
+                "method": method,
+                "url": url,
+                "headers": [[key, value] for key, value in headers.items()]
+            },
+            body
+        )
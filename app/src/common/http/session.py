@@ -1,19 +1,130 @@
 # -*- coding: utf-8 -*-
 import os
-import ctypes
 import binascii
+import gzip
 import uuid
 import json
+import queue
+from time import perf_counter
+from tempfile import SpooledTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlencode
+from common import bridge
 from common.errors import HTTPError as HubHTTPError
 from common.utils import extract_domain
 from tasks.common.errors import HTTPError as TaskHTTPError
-from .classes import Request, Response, Headers, Cookies
+from .classes import Response, Headers, Cookies
 from .client import CLIENT
+from .codecs import CODEC, FrameCodec, IS_BATCH_SUPPORTED, execute_batch
+from .metrics import METRICS
+from .cassette import CASSETTE
 from .constants import CLIENTS
 
 
-class Session:
+EXECUTOR = ThreadPoolExecutor(max_workers=32)
+
+
+class BaseSession:
+    spool_size = 1_000_000
+
+    @staticmethod
+    def is_stream(value):
+        return (
+            isinstance(value, tuple) and len(value) >= 3 and (
+                len(value) == 4 or not isinstance(value[2], (str, bytes))
+            )
+        )
+
+    @staticmethod
+    def write_content(file, content):
+        if hasattr(content, "read"):
+            while chunk := content.read(65536):
+                file.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        elif isinstance(content, (str, bytes)):
+            file.write(content.encode() if isinstance(content, str) else content)
+        else:
+            for chunk in content:
+                file.write(chunk.encode() if isinstance(chunk, str) else chunk)
+
+    def stream_multipart(self, body, boundary):
+        file = SpooledTemporaryFile(max_size=self.spool_size)
+
+        for key, value in body.items():
+            if isinstance(value, tuple) and len(value) >= 3:
+                file_name, content_type, content = value[:3]
+                encoding = value[3] if len(value) == 4 else None
+
+                file.write((
+                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"; filename="{file_name}"\n'
+                    f'Content-Type: {"application/gzip" if encoding == "gzip" else content_type}\n\n'
+                ).encode())
+
+                if encoding == "gzip":
+                    with gzip.GzipFile(fileobj=file, mode="wb") as gzip_file:
+                        self.write_content(gzip_file, content)
+                else:
+                    self.write_content(file, content)
+
+                file.write(b"\n")
+            else:
+                file.write(
+                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"\n\n{value}\n'.encode()
+                )
+
+        file.write(f"--{boundary}--\n".encode())
+        file.seek(0)
+
+        return file
+
+    def format_body(self, body, content_type):
+        if content_type in ["application/json", "text/plain"]:
+            return json.dumps(body, ensure_ascii=False), content_type
+        elif content_type == "application/x-www-form-urlencoded":
+            return urlencode(body), content_type
+        elif content_type == "multipart/form-data":
+            boundary = binascii.hexlify(os.urandom(16)).decode()
+
+            if any(self.is_stream(value) for value in body.values()):
+                return (
+                    self.stream_multipart(body, boundary),
+                    f"multipart/form-data; boundary={boundary}"
+                )
+
+            return (
+                "".join(
+                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"; filename="{value[0]}"\nContent-Type: {value[1]}\n\n{value[2]}\n'
+                    if isinstance(value, tuple) and len(value) == 3 else
+                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"\n\n{value}\n'
+                    for key, value in body.items()
+                ) + f"--{boundary}--\n",
+                f"multipart/form-data; boundary={boundary}"
+            )
+        else:
+            raise self.http_error
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
+class Session(BaseSession):
+    profiles = {}
+    mutable_settings = ["uuid", "proxy", "timeout"]
+
     def __init__(self, client="chrome", proxy=None, **kwargs):
         self.settings = {
             "uuid": str(uuid.uuid4()),
@@ -33,21 +144,45 @@ class Session:
         self.cookies = Cookies(self.settings["uuid"])
         self.proxy = proxy
 
-        if function := kwargs.get("hook"):
-            self.request = function(self.request)
+        self.hook = kwargs.get("hook")
+        if self.hook:
+            self.request = self.hook(self.request)
 
         if kwargs.get("in_hub"):
             self.http_error = HubHTTPError
         else:
             self.http_error = TaskHTTPError
 
+        self.is_configured = False
         self.configure_client()
 
-    def configure_client(self):
-        CLIENT.createClient(
-            json.dumps(self.settings).encode()
+    def encode_settings(self):
+        key = (
+            self.settings["enableCookieJar"], self.settings["discardResponse"], self.settings["sslpin"],
+            id(self.settings["clienthello"]), id(self.settings["http2Frame"])
         )
 
+        if key not in self.profiles:
+            self.profiles[key] = json.dumps({
+                name: value for name, value in self.settings.items()
+                if name not in self.mutable_settings
+            })[:-1], self.settings["clienthello"], self.settings["http2Frame"]
+
+        return (
+            self.profiles[key][0] + ", " + json.dumps({
+                name: self.settings[name] for name in self.mutable_settings
+            })[1:]
+        ).encode()
+
+    def configure_client(self):
+        if self.is_configured and hasattr(CLIENT, "updateClient"):
+            CLIENT.updateClient(json.dumps({
+                key: self.settings[key] for key in self.mutable_settings
+            }).encode())
+        else:
+            CLIENT.createClient(self.encode_settings())
+            self.is_configured = True
+
     def set_proxy(self, proxy):
         self.settings["proxy"] = proxy.url
         self.proxy = proxy
@@ -60,26 +195,6 @@ class Session:
 
         self.configure_client()
 
-    def format_body(self, body, content_type):
-        if content_type in ["application/json", "text/plain"]:
-            return json.dumps(body, ensure_ascii=False), content_type
-        elif content_type == "application/x-www-form-urlencoded":
-            return urlencode(body), content_type
-        elif content_type == "multipart/form-data":
-            boundary = binascii.hexlify(os.urandom(16)).decode()
-
-            return (
-                "".join(
-                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"; filename="{value[0]}"\nContent-Type: {value[1]}\n\n{value[2]}\n'
-                    if isinstance(value, tuple) and len(value) == 3 else
-                    f'--{boundary}\nContent-Disposition: form-data; name="{key}"\n\n{value}\n'
-                    for key, value in body.items()
-                ) + f"--{boundary}--\n",
-                f"multipart/form-data; boundary={boundary}"
-            )
-        else:
-            raise self.http_error
-
     def format_headers(self, headers):
         for header in headers:
             if header.lower() == "user-agent":
@@ -97,25 +212,104 @@ class Session:
             [key, value] for key, value in headers.items()
         ]
 
-    def get(self, url, **kwargs):
-        return self.request("GET", url, **kwargs)
+    def request(self, method, url, params=None, body=None, headers=None, **kwargs):
+        start = perf_counter()
+        request = self.build_request(method, url, params, body, headers, **kwargs)
+        timings = {"encode": perf_counter() - start}
 
-    def post(self, url, **kwargs):
-        return self.request("POST", url, **kwargs)
+        response = self.execute(request, timings)
 
-    def head(self, url, **kwargs):
-        return self.request("HEAD", url, **kwargs)
+        start = perf_counter()
+        try:
+            if kwargs.get("discard_response"):
+                if response["Status"] in [0, 999]:
+                    raise self.http_error
 
-    def patch(self, url, **kwargs):
-        return self.request("PATCH", url, **kwargs)
+                self.store_cookies(response)
+                return response["Status"]
 
-    def put(self, url, **kwargs):
-        return self.request("PUT", url, **kwargs)
+            return self.build_response(
+                response, request, body
+            )
+        finally:
+            timings["decode"] += perf_counter() - start
+            METRICS.record(method, request["url"], response["Status"], timings)
+
+    def batch(self, requests):
+        results = queue.SimpleQueue()
+
+        if IS_BATCH_SUPPORTED and not CASSETTE.mode and not self.hook:
+            requests = [
+                (request, self.build_request(**request))
+                for request in requests
+            ]
+
+            def execute():
+                delivered = set()
+                start = perf_counter()
+
+                def on_response(index, response):
+                    delivered.add(index)
+                    results.put((index, response, perf_counter() - start))
+
+                try:
+                    execute_batch([request for _, request in requests], on_response)
+                finally:
+                    for index in range(len(requests)):
+                        if index not in delivered:
+                            results.put((index, None, None))
+
+            EXECUTOR.submit(execute)
+
+            for _ in requests:
+                index, response, duration = bridge.call(results.get)
+                if not response:
+                    yield index, None
+                    continue
+
+                request, encoded_request = requests[index]
+                METRICS.record(
+                    encoded_request["method"], encoded_request["url"],
+                    response["Status"], {"network": duration}
+                )
 
-    def delete(self, url, **kwargs):
-        return self.request("DELETE", url, **kwargs)
+                try:
+                    yield index, self.build_response(
+                        response, encoded_request, request.get("body")
+                    )
+                except self.http_error:
+                    yield index, None
+        else:
+            def execute(index, request):
+                try:
+                    results.put((index, self.request(**request)))
+                except Exception:
+                    results.put((index, None))
 
-    def request(self, method, url, params=None, body=None, headers=None, **kwargs):
+            for index, request in enumerate(requests):
+                EXECUTOR.submit(execute, index, request)
+
+            for _ in requests:
+                yield bridge.call(results.get)
+
+    def execute(self, request, timings=None):
+        timings = {} if timings is None else timings
+
+        if CASSETTE.is_replaying:
+            start = perf_counter()
+            response = CASSETTE.replay(request)
+            timings["network"] = perf_counter() - start
+            timings.setdefault("decode", 0)
+
+            return response
+
+        response = CODEC.execute(request, timings)
+        if CASSETTE.is_recording:
+            CASSETTE.record(request, response)
+
+        return response
+
+    def build_request(self, method, url, params=None, body=None, headers=None, **kwargs):
         request = {
             "method": method,
             "url": url,
@@ -141,19 +335,21 @@ class Session:
                 body, headers[content_type_name].split(";")[0]
             )
 
-        request["headers"] = self.format_headers(headers)
+            if hasattr(request["body"], "read"):
+                with request["body"] as file:
+                    request["body"] = file.read()
 
-        raw_response = CLIENT.execReq(
-            json.dumps(request).encode()
-        )
-        response = json.loads(
-            ctypes.c_char_p.from_buffer(raw_response).value
-        )
-        CLIENT.freeMemory(raw_response)
+                if CODEC is not FrameCodec:
+                    try:
+                        request["body"] = request["body"].decode()
+                    except UnicodeDecodeError:
+                        raise self.http_error
 
-        if response["Status"] in [0, 999]:
-            raise self.http_error
+        request["headers"] = self.format_headers(headers)
 
+        return request
+
+    def store_cookies(self, response):
         if response["Cookies"] and response["Cookies"] != "null":
             for cookie in response["Cookies"]:
                 self.cookies.set_local(
@@ -162,6 +358,12 @@ class Session:
         else:
             response["Cookies"] = {}
 
+    def build_response(self, response, request, body):
+        if response["Status"] in [0, 999]:
+            raise self.http_error
+
+        self.store_cookies(response)
+
         return Response(
-            response, Request(request | {"body": body})
+            response, request, body
         )
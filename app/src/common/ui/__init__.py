@@ -2,3 +2,4 @@
 from . import logger
 from .utils import clear, recede_cursor, enter, set_console_title, fetch_input
 from .loading_bar import LoadingBar
+from .title_renderer import TitleRenderer
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from threading import Thread
+from common.utils import sleep
+from .utils import set_console_title
+
+
+class TitleRenderer:
+    interval = .1
+
+    def __init__(self, render):
+        self.render = render
+
+        self.is_dirty = False
+        self.in_progress = False
+        self.thread = None
+
+    def update(self):
+        self.is_dirty = True
+
+    def draw(self):
+        self.is_dirty = False
+        set_console_title(self.render())
+
+    def start(self):
+        self.draw()
+
+        if not self.in_progress:
+            self.in_progress = True
+
+            self.thread = Thread(target=self.animation, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.in_progress = False
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+        self.draw()
+
+    def animation(self):
+        while self.in_progress:
+            if self.is_dirty:
+                self.draw()
+
+            sleep(self.interval)
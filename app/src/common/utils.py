@@ -16,7 +16,7 @@ from constants import app
 from constants.env import OS, TEMP_PATH
 from constants.apis import MAPBOX_KEY
 from .errors import HTTPError, JSONError, DownloadError
-from . import data, http
+from . import bridge, data, http
 
 
 def close(delay=8):
@@ -25,7 +25,7 @@ def close(delay=8):
 
 
 def sleep(duration):
-    time.sleep(duration)
+    bridge.sleep(duration)
 
 
 def current_ts(exact=False):
@@ -215,7 +215,7 @@ def deep_update(base_dict, filled_dict):
 
 def fetch_coordinate(country, city):
     try:
-        response = http.get(
+        response = http.POOL.get(
             f"https://api.mapbox.com/geocoding/v5/mapbox.places/{quote_plus(city)}.json",
             params={
                 "access_token": MAPBOX_KEY,
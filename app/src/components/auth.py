@@ -8,10 +8,10 @@ from managers import FileManager
 
 
 class Auth:
-    def __init__(self):
+    def __init__(self, pipeline=None):
         license_key = self.fetch_license_key()
 
-        self.validate_license(license_key)
+        self.validate_license(license_key, pipeline)
 
     @staticmethod
     def fetch_license_key():
@@ -41,14 +41,14 @@ class Auth:
         return license_key
 
     @staticmethod
-    def validate_license(license_key):
+    def validate_license(license_key, pipeline=None):
         loading_bar = ui.LoadingBar("Validating license")
 
         try:
-            response = http.post(
+            response = http.POOL.post(
                 f"https://{API_DOMAIN}/auth/{license_key}",
                 body={
-                    "deviceId": fetch_device_id()
+                    "deviceId": pipeline.result("deviceId") if pipeline else fetch_device_id()
                 },
                 headers={
                     "content-type": "application/json",
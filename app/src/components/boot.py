@@ -9,25 +9,39 @@ from constants.apis import API_DOMAIN
 from common import data, errors, http, utils
 from common.security import generate_bearer, verify_response
 from common.ui import LoadingBar, logger
-from managers import AnalyticsManager, FileManager, LogManager, ModuleManager, ProxyManager
+from managers import AnalyticsManager, EntriesManager, FileIndex, FileManager, LogManager, ModuleManager, ProxyManager, SessionsManager
+from .pipeline import Pipeline
 
 
 class Boot:
-    def __init__(self):
+    def __init__(self, pipeline=None):
         self.loading_bar = LoadingBar("Setting up", min_duration=.7)
 
-        self.verify_storage_dir()
-        self.verify_user_files()
+        if not pipeline:
+            pipeline = self.start_pipeline()
+
+        pipeline.add("licensedFiles", self.verify_licensed_files, ["storage", "userFiles"])
+        results = pipeline.wait()
 
         self.clear_files()
         self.fetch_files_on_interval()
-        self.validate_license_on_interval()
+        self.validate_license_on_interval(results["deviceId"])
         self.set_rich_presence(asyncio.get_event_loop())
         if env.STAGE.PROD:
             self.monitor_threats()
 
         self.loading_bar.success()
 
+    @staticmethod
+    def start_pipeline():
+        pipeline = Pipeline()
+
+        pipeline.add("deviceId", utils.fetch_device_id)
+        pipeline.add("storage", Boot.verify_storage_dir)
+        pipeline.add("userFiles", Boot.verify_user_files)
+
+        return pipeline
+
     @staticmethod
     def verify_storage_dir():
         if not env.STORAGE_PATH.is_dir():
@@ -45,9 +59,27 @@ class Boot:
         if not env.TEMP_PATH.is_dir():
             env.TEMP_PATH.mkdir()
 
+    @staticmethod
+    def verify_module_dir(module, is_site):
+        path = (
+            (env.SITES_PATH if is_site else env.TOOLS_PATH) / module.translate(env.ILLEGAL_FILE_CHARS)
+        )
+        if not path.is_dir():
+            path.mkdir()
+
+            if file_data := (env.SITE_FILES if is_site else env.TOOL_FILES).get(module):
+                with open(path / file_data["placeholder"], "w", encoding=env.FILE_ENCODING) as file:
+                    file.writelines([
+                        ",".join(file_data["fields"].keys()) + "\n",
+                        ",".join(file_data["fields"].values())
+                    ])
+
+        if not (path / env.RESULTS_PATH).is_dir():
+            (path / env.RESULTS_PATH).mkdir()
+
     @staticmethod
     def verify_user_files():
-        site_list, tool_list = ModuleManager.get_modules()
+        site_list, tool_list = ModuleManager.get_public_modules()
 
         if not env.SITES_PATH.is_dir():
             env.SITES_PATH.mkdir()
@@ -62,46 +94,27 @@ class Boot:
                 file.write("ip:port\nip:port:user:pass")
 
         for site in site_list:
-            path = env.SITES_PATH / site.translate(env.ILLEGAL_FILE_CHARS)
-            if not path.is_dir():
-                path.mkdir()
-
-                if file_data := env.SITE_FILES.get(site):
-                    with open(path / file_data["placeholder"], "w", encoding=env.FILE_ENCODING) as file:
-                        file.writelines([
-                            ",".join(file_data["fields"].keys()) + "\n",
-                            ",".join(file_data["fields"].values())
-                        ])
-
-            if not (path / env.RESULTS_PATH).is_dir():
-                (path / env.RESULTS_PATH).mkdir()
+            Boot.verify_module_dir(site, is_site=True)
 
         for tool in tool_list:
-            path = env.TOOLS_PATH / tool.translate(env.ILLEGAL_FILE_CHARS)
-            if not path.is_dir():
-                path.mkdir()
+            Boot.verify_module_dir(tool, is_site=False)
 
-                if file_data := env.TOOL_FILES.get(tool):
-                    with open(path / file_data["placeholder"], "w", encoding=env.FILE_ENCODING) as file:
-                        file.writelines([
-                            ",".join(file_data["fields"].keys()) + "\n",
-                            ",".join(file_data["fields"].values())
-                        ])
+        if not env.MASTERS_PATH.is_file():
+            with open(env.MASTERS_PATH, "w", encoding=env.FILE_ENCODING) as file:
+                file.write("Email,Password\n,")
 
-            if not (path / env.RESULTS_PATH).is_dir():
-                (path / env.RESULTS_PATH).mkdir()
+    @staticmethod
+    def verify_licensed_files():
+        site_list, tool_list = ModuleManager.get_modules()
+        public_site_list, public_tool_list = ModuleManager.get_public_modules()
 
         for site in site_list:
-            file_path = env.ENTRIES_PATH / f"{site.lower().replace(' ', '_').strip('.?')}.json"
-            if not file_path.exists():
-                with open(file_path, "w", encoding=env.FILE_ENCODING) as file:
-                    file.write("{}")
+            if site not in public_site_list:
+                Boot.verify_module_dir(site, is_site=True)
 
-        for module in site_list + tool_list:
-            file_path = env.SESSIONS_PATH / f"{module.lower().replace(' ', '_').strip('.?')}.json"
-            if not file_path.exists():
-                with open(file_path, "w", encoding=env.FILE_ENCODING) as file:
-                    file.write("{}")
+        for tool in tool_list:
+            if tool not in public_tool_list:
+                Boot.verify_module_dir(tool, is_site=False)
 
         if env.SETTINGS_PATH.is_file():
             settings = FileManager.fetch_json_file(env.SETTINGS_PATH)
@@ -118,10 +131,6 @@ class Boot:
                 settings, indent=4
             ))
 
-        if not env.MASTERS_PATH.is_file():
-            with open(env.MASTERS_PATH, "w", encoding=env.FILE_ENCODING) as file:
-                file.write("Email,Password\n,")
-
     @staticmethod
     @utils.threaded
     def clear_files():
@@ -140,19 +149,8 @@ class Boot:
                     else:
                         shutil.rmtree(path)
 
-        for site in site_list:
-            file_path = env.ENTRIES_PATH / f"{site.lower().replace(' ', '_').strip('.?')}.json"
-            with open(file_path, encoding=env.FILE_ENCODING) as file:
-                content = json.load(file)
-
-            for key, value in list(content.items()):
-                if utils.calc_ts_delta(value["timestamp"]) > 21:
-                    del content[key]
-
-            with open(file_path, "w", encoding=env.FILE_ENCODING) as file:
-                file.write(json.dumps(
-                    content, indent=4
-                ))
+        EntriesManager.prune(max_age=21)
+        SessionsManager.prune()
 
         for file_path in env.LOGS_PATH.iterdir():
             if utils.calc_ts_delta(file_path.stat().st_mtime) > 21:
@@ -182,23 +180,33 @@ class Boot:
             for site, config in sites.items():
                 path = env.SITES_PATH / site.translate(env.ILLEGAL_FILE_CHARS)
                 if config["input"].get("fileType") == "dir":
-                    data.SITE_FILES[site] = FileManager.fetch_loaded_dirs(path)
+                    files = FileManager.fetch_loaded_dirs(path)
                 else:
-                    data.SITE_FILES[site] = FileManager.fetch_loaded_csv_files(path)
+                    files = FileManager.fetch_loaded_csv_files(path)
+
+                if FileIndex.publish("sites", site, files):
+                    data.SITE_FILES[site] = files
 
             for tool, config in tools.items():
                 path = env.TOOLS_PATH / tool.translate(env.ILLEGAL_FILE_CHARS)
                 if config["input"].get("fileType") == "dir":
-                    data.TOOL_FILES[tool] = FileManager.fetch_loaded_dirs(path)
+                    files = FileManager.fetch_loaded_dirs(path)
                 else:
-                    data.TOOL_FILES[tool] = FileManager.fetch_loaded_csv_files(path)
+                    files = FileManager.fetch_loaded_csv_files(path)
+
+                if FileIndex.publish("tools", tool, files):
+                    data.TOOL_FILES[tool] = files
 
-            data.PROXY_FILES = ProxyManager.fetch_loaded_files()
+            files = ProxyManager.fetch_loaded_files()
+            if FileIndex.publish("proxies", None, files):
+                data.PROXY_FILES = files
 
             try:
-                data.SETTINGS = utils.deep_update(
-                    data.SETTINGS, FileManager.fetch_json_file(env.SETTINGS_PATH)
-                )
+                settings = FileIndex.get(env.SETTINGS_PATH, FileManager.fetch_json_file)
+                if FileIndex.publish("settings", None, settings):
+                    data.SETTINGS = utils.deep_update(
+                        data.SETTINGS, settings
+                    )
             except errors.FileError:
                 pass
 
@@ -206,15 +214,15 @@ class Boot:
 
     @staticmethod
     @utils.threaded
-    def validate_license_on_interval():
+    def validate_license_on_interval(device_id):
         while True:
             utils.sleep(300)
 
             try:
-                response = http.post(
+                response = http.POOL.post(
                     f"https://{API_DOMAIN}/auth/{data.USER['licenseKey']}",
                     body={
-                        "deviceId": utils.fetch_device_id()
+                        "deviceId": device_id
                     },
                     headers={
                         "content-type": "application/json",
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class Pipeline:
+    def __init__(self, max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def execute(future, function, dependencies):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        for dependency in dependencies:
+            if error := dependency.exception():
+                future.set_exception(error)
+                return
+
+        try:
+            future.set_result(function())
+        except BaseException as error:
+            future.set_exception(error)
+
+    def add(self, name, function, dependencies=()):
+        future = Future()
+        dependencies = [self.futures[dependency] for dependency in dependencies]
+        remaining = [len(dependencies)]
+
+        def on_dependency_done(_):
+            with self.lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+
+            self.executor.submit(self.execute, future, function, dependencies)
+
+        self.futures[name] = future
+        if dependencies:
+            for dependency in dependencies:
+                dependency.add_done_callback(on_dependency_done)
+        else:
+            self.executor.submit(self.execute, future, function, dependencies)
+
+        return future
+
+    def result(self, name):
+        return self.futures[name].result()
+
+    def wait(self):
+        results = {
+            name: future.result()
+            for name, future in self.futures.items()
+        }
+        self.executor.shutdown(wait=False)
+
+        return results
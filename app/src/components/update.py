@@ -12,10 +12,13 @@ from .boot import Boot
 
 
 class Update:
-    def __init__(self):
+    def __init__(self, pipeline=None):
         self.loading_bar = LoadingBar("Installing update")
 
-        Boot.verify_storage_dir()
+        if pipeline:
+            pipeline.result("storage")
+        else:
+            Boot.verify_storage_dir()
         self.new_file_path = generate_temp_path("app", OS.app_ext)
 
         self.download_file()
@@ -57,6 +57,10 @@ TOOLS_PATH = Path("tools")
 PROXIES_PATH = Path("proxies")
 RESULTS_PATH = Path("results")
 
+CASSETTE_MODE = os.environ.get("CASSETTE", "").lower()
+CASSETTE_PATH = Path(os.environ.get("CASSETTE_PATH", "cassette.jsonl"))
+CASSETTE_LATENCY = os.environ.get("CASSETTE_LATENCY", "0")
+
 SETTINGS_PATH = Path("settings.json")
 MASTERS_PATH = Path("masters.csv")
 
@@ -68,7 +72,8 @@ SETTINGS_FIELDS = {
         "key": ""
     },
     "capsolver-key": "",
-    "mapbox-key": ""
+    "mapbox-key": "",
+    "task-engine": "threads"
 }
 PROFILE_FIELDS = {
     "Email": "example@email.com",
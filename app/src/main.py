@@ -10,11 +10,12 @@ from components import Auth, Boot, Hub, Update
 
 def main():
     hub = Hub()
+    pipeline = Boot.start_pipeline()
 
-    Auth()
+    Auth(pipeline)
     if is_update_available() and STAGE.PROD:
-        Update()
-    Boot()
+        Update(pipeline)
+    Boot(pipeline)
 
     hub.main_menu()
 
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
+from .index import FileIndex
 from .analytics import AnalyticsManager
 from .files import FileManager
 from .entries import EntriesManager
 from .logs import LogManager
 from .modules import ModuleManager
 from .proxies import ProxyManager
+from .results import ResultsManager
 from .sessions import SessionsManager
 from .tasks import TaskManager
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 import json
 import threading
+from collections import Counter
 from functools import partial
 from constants.env import FILE_ENCODING
 from constants.apis import API_DOMAIN
 from common import data, http
-from common.utils import generate_temp_path
+from common.utils import sleep, generate_temp_path, threaded
 from common.errors import HTTPError
 from common.security import generate_bearer
 
@@ -14,33 +15,62 @@ file_lock = threading.Lock()
 
 
 class AnalyticsManager:
+    snapshot_interval = 10
+    batch_size = 25
+
     def __init__(self, site, category):
+        self.site = site
         self.category = category
 
+        self.counters = Counter()
+        self.lock = threading.Lock()
+
         self.file_path = generate_temp_path("analytics", ".json")
         with open(self.file_path, "w", encoding=FILE_ENCODING) as file:
             file.write(json.dumps({
                 "site": site,
-                "productName": None,
-                category: 0
+                "raffles": {}
             }, indent=4))
 
         self.export = partial(self.export, self.file_path)
 
+        self.is_open = True
+        self.snapshot_on_interval()
+
+    @staticmethod
+    def load(file_path):
+        with open(file_path, encoding=FILE_ENCODING) as file:
+            content = json.load(file)
+
+        if "raffles" not in content:
+            content = {
+                "site": content["site"],
+                "raffles": {
+                    content["productName"]: {
+                        "entries": content.get("entries", 0),
+                        "wins": content.get("wins", 0)
+                    }
+                } if content["productName"] else {}
+            }
+
+        return content
+
     @staticmethod
     def export(file_path, keep_file=False):
         with file_lock:
-            with open(file_path, encoding=FILE_ENCODING) as file:
-                content = json.load(file)
+            content = AnalyticsManager.load(file_path)
 
-            entries = content.get("entries", 0)
-            wins = content.get("wins", 0)
             site = content["site"]
-            product_name = content["productName"]
+            raffles = {
+                product_name: {
+                    "entries": raffle.get("entries", 0),
+                    "wins": raffle.get("wins", 0)
+                } for product_name, raffle in content["raffles"].items()
+                if raffle.get("entries") or raffle.get("wins")
+            }
 
             if keep_file:
-                content["entries"] = 0
-                content["wins"] = 0
+                content["raffles"] = {}
 
                 with open(file_path, "w", encoding=FILE_ENCODING) as file:
                     file.write(json.dumps(
@@ -49,53 +79,104 @@ class AnalyticsManager:
             else:
                 file_path.unlink()
 
-        if not (entries or wins):
-            return
-
-        if site in data.USER["analytics"]:
-            if product_name in data.USER["analytics"][site]:
-                data.USER["analytics"][site][product_name]["entries"] += entries
-                data.USER["analytics"][site][product_name]["wins"] += wins
-            else:
-                data.USER["analytics"][site][product_name] = {
-                    "entries": entries,
-                    "wins": wins
-                }
-        else:
-            data.USER["analytics"][site] = {
-                product_name: {
-                    "entries": entries,
-                    "wins": wins
-                }
+        products = list(raffles)
+        for index in range(0, len(products), AnalyticsManager.batch_size):
+            batch = {
+                product_name: raffles[product_name]
+                for product_name in products[index:index + AnalyticsManager.batch_size]
             }
 
-        try:
-            http.post(
-                f"https://{API_DOMAIN}/analytics/{data.USER['id']}",
-                body={
+            try:
+                status = http.POOL.post(
+                    f"https://{API_DOMAIN}/analytics/{data.USER['id']}/batch",
+                    body={
+                        "deltas": [
+                            {
+                                "site": site,
+                                "productName": product_name,
+                                "entries": raffle["entries"],
+                                "wins": raffle["wins"]
+                            } for product_name, raffle in batch.items()
+                        ]
+                    },
+                    headers={
+                        "content-type": "application/json",
+                        "authorization": generate_bearer()
+                    },
+                    discard_response=True
+                )
+            except HTTPError:
+                status = None
+
+            if status != 200:
+                AnalyticsManager.restore(file_path, site, batch)
+                continue
+
+            site_analytics = data.USER["analytics"].setdefault(site, {})
+            for product_name, raffle in batch.items():
+                if product_name in site_analytics:
+                    site_analytics[product_name]["entries"] += raffle["entries"]
+                    site_analytics[product_name]["wins"] += raffle["wins"]
+                else:
+                    site_analytics[product_name] = raffle.copy()
+
+    @staticmethod
+    def restore(file_path, site, raffles):
+        with file_lock:
+            try:
+                content = AnalyticsManager.load(file_path)
+            except FileNotFoundError:
+                content = {
                     "site": site,
-                    "productName": product_name,
-                    "entries": entries,
-                    "wins": wins
-                },
-                headers={
-                    "content-type": "application/json",
-                    "authorization": generate_bearer()
+                    "raffles": {}
                 }
-            )
-        except HTTPError:
-            pass
 
-    def increment(self, product):
+            for product_name, raffle in raffles.items():
+                saved_raffle = content["raffles"].setdefault(product_name, {
+                    "entries": 0,
+                    "wins": 0
+                })
+                saved_raffle["entries"] = saved_raffle.get("entries", 0) + raffle["entries"]
+                saved_raffle["wins"] = saved_raffle.get("wins", 0) + raffle["wins"]
+
+            with open(file_path, "w", encoding=FILE_ENCODING) as file:
+                file.write(json.dumps(
+                    content, indent=4
+                ))
+
+    @threaded
+    def snapshot_on_interval(self):
+        while self.is_open:
+            sleep(self.snapshot_interval)
+            self.snapshot()
+
+    def snapshot(self):
         with file_lock:
-            with open(self.file_path, encoding=FILE_ENCODING) as file:
-                content = json.load(file)
+            with self.lock:
+                counters, self.counters = self.counters, Counter()
+
+            if not counters:
+                return
+
+            content = self.load(self.file_path)
 
-            content[self.category] += 1
-            if not content["productName"]:
-                content["productName"] = product.name
+            for product_name, amount in counters.items():
+                raffle = content["raffles"].setdefault(product_name, {
+                    "entries": 0,
+                    "wins": 0
+                })
+                raffle[self.category] = raffle.get(self.category, 0) + amount
 
             with open(self.file_path, "w", encoding=FILE_ENCODING) as file:
                 file.write(json.dumps(
                     content, indent=4
                 ))
+
+    def finish(self):
+        self.is_open = False
+        self.snapshot()
+        self.export()
+
+    def increment(self, product):
+        with self.lock:
+            self.counters[product.name] += 1
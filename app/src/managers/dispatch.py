@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import deque
+from common import bridge
+
+
+class TaskQueue:
+    poll_interval = .25
+
+    def __init__(self, tasks=(), is_open=False):
+        self.tasks = deque(tasks)
+
+        self.available = threading.Semaphore(len(self.tasks))
+        self.is_open = is_open
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def put(self, task):
+        self.tasks.append(task)
+        self.available.release()
+
+    def acquire(self):
+        if not bridge.is_bridged():
+            return self.available.acquire(timeout=self.poll_interval)
+
+        if self.available.acquire(blocking=False):
+            return True
+
+        bridge.sleep(self.poll_interval)
+        return False
+
+    def get(self):
+        while True:
+            is_open = self.is_open
+            if is_open and self.acquire():
+                return self.tasks.popleft()
+            elif self.available.acquire(blocking=False):
+                return self.tasks.popleft()
+            elif not is_open:
+                return None
@@ -1,37 +1,94 @@
 # -*- coding: utf-8 -*-
 import json
-import threading
 from constants.env import FILE_ENCODING, ENTRIES_PATH
-from common.utils import current_ts
+from common.database import Database
+from common.errors import JSONError
+from common.utils import current_ts, calc_ts_delta
 from common.ui import logger
-from tasks.common.classes import CaseInsensitiveDict
 
 
-file_lock = threading.Lock()
+DATABASE = Database(ENTRIES_PATH / "entries.db", """
+    CREATE TABLE IF NOT EXISTS raffles (
+        site TEXT NOT NULL,
+        product TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        PRIMARY KEY (site, product)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS entries (
+        site TEXT NOT NULL,
+        product TEXT NOT NULL,
+        parent_id TEXT NOT NULL,
+        PRIMARY KEY (site, product, parent_id)
+    ) WITHOUT ROWID;
+""")
 
 
 class EntriesManager:
     def __init__(self, site, product):
-        self.site = site
-        self.product = product
+        self.site = self.format_site(site)
+        self.product = product.lower()
+
+        self.migrate()
+
+        DATABASE.execute(
+            "INSERT OR IGNORE INTO raffles VALUES (?, ?, ?)",
+            (self.site, self.product, current_ts())
+        )
+        self.entries = {
+            row[0] for row in DATABASE.fetch_all(
+                "SELECT parent_id FROM entries WHERE site = ? AND product = ?",
+                (self.site, self.product)
+            )
+        }
 
-        self.file_path = ENTRIES_PATH / f"{site.lower().replace(' ', '_').strip('.?')}.json"
-        with open(self.file_path, encoding=FILE_ENCODING) as file:
-            content = CaseInsensitiveDict(json.load(file))
+    @staticmethod
+    def format_site(site):
+        return site.lower().replace(" ", "_").strip(".?")
 
-        if self.product in content:
-            self.entries = content[self.product]["entries"]
-        else:
-            self.entries = []
-            content[self.product] = {
-                "timestamp": current_ts(),
-                "entries": []
-            }
+    @staticmethod
+    def migrate():
+        for file_path in ENTRIES_PATH.glob("*.json"):
+            try:
+                with open(file_path, encoding=FILE_ENCODING) as file:
+                    content = json.load(file)
+            except (FileNotFoundError, PermissionError, JSONError):
+                continue
+
+            site = file_path.stem
+            DATABASE.execute_many(
+                "INSERT OR IGNORE INTO raffles VALUES (?, ?, ?)", [
+                    (site, product.lower(), value["timestamp"])
+                    for product, value in content.items()
+                ]
+            )
+            DATABASE.execute_many(
+                "INSERT OR IGNORE INTO entries VALUES (?, ?, ?)", [
+                    (site, product.lower(), parent_id.lower())
+                    for product, value in content.items()
+                    for parent_id in value["entries"]
+                ]
+            )
+
+            file_path.unlink(missing_ok=True)
 
-        with open(self.file_path, "w", encoding=FILE_ENCODING) as file:
-            file.write(json.dumps(
-                content, indent=4
-            ))
+    @staticmethod
+    def prune(max_age=21):
+        EntriesManager.migrate()
+
+        expired = [
+            (site, product) for site, product, timestamp in DATABASE.fetch_all(
+                "SELECT site, product, timestamp FROM raffles"
+            ) if calc_ts_delta(timestamp) > max_age
+        ]
+
+        if expired:
+            DATABASE.execute_many(
+                "DELETE FROM entries WHERE site = ? AND product = ?", expired
+            )
+            DATABASE.execute_many(
+                "DELETE FROM raffles WHERE site = ? AND product = ?", expired
+            )
+            DATABASE.compact()
 
     @staticmethod
     def is_clear_command(command):
@@ -41,22 +98,17 @@ class EntriesManager:
     def clear(command):
         components = command.split()
 
-        file_path = ENTRIES_PATH / f"{components[2].lower().strip('.?')}.json"
-        product = components[3]
-
-        try:
-            with open(file_path, encoding=FILE_ENCODING) as file:
-                content = CaseInsensitiveDict(json.load(file))
-
-            del content[product]
+        site = components[2].lower().strip(".?")
+        product = components[3].lower()
 
-            with open(file_path, "w", encoding=FILE_ENCODING) as file:
-                file.write(json.dumps(
-                    content, indent=4
-                ))
+        EntriesManager.migrate()
 
+        DATABASE.execute(
+            "DELETE FROM entries WHERE site = ? AND product = ?", (site, product)
+        )
+        if DATABASE.execute("DELETE FROM raffles WHERE site = ? AND product = ?", (site, product)):
             logger.success("Cleared entries")
-        except (FileNotFoundError, KeyError):
+        else:
             logger.error("No entries to clear")
 
     def filter(self, parents):
@@ -66,13 +118,10 @@ class EntriesManager:
         ]
 
     def save(self, parent):
-        with file_lock:
-            with open(self.file_path, encoding=FILE_ENCODING) as file:
-                content = CaseInsensitiveDict(json.load(file))
-
-            content[self.product]["entries"].append(parent.id.lower())
+        parent_id = parent.id.lower()
 
-            with open(self.file_path, "w", encoding=FILE_ENCODING) as file:
-                file.write(json.dumps(
-                    content, indent=4
-                ))
+        self.entries.add(parent_id)
+        DATABASE.execute(
+            "INSERT OR IGNORE INTO entries VALUES (?, ?, ?)",
+            (self.site, self.product, parent_id)
+        )
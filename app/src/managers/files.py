@@ -4,6 +4,7 @@ import csv
 import random
 from constants.env import FILE_ENCODING, RESULTS_PATH
 from common.errors import FileError, JSONError
+from .index import FileIndex
 
 
 class FileManager:
@@ -13,7 +14,7 @@ class FileManager:
         try:
             for file_path in path.iterdir():
                 if file_path.is_file() and ".csv" in file_path.name:
-                    if line_count := FileManager.fetch_line_count(file_path) - 1:
+                    if line_count := FileIndex.get(file_path, FileManager.fetch_line_count) - 1:
                         results.append({
                             "fileName": file_path.name,
                             "lineCount": line_count
@@ -79,18 +80,32 @@ class FileManager:
             raise FileError(file_path.name, "malformed")
 
     @staticmethod
-    def fetch_csv_files(path, files):
-        results = []
+    def stream_csv_files(path, files, chunk_size=500, buffer_size=10_000):
+        buffer = []
+        chunk = []
         for file_name in files:
             try:
                 with open(path / file_name, encoding=FILE_ENCODING) as file:
-                    results += [
-                        line for line in csv.DictReader(file)
-                        if None not in line and None not in line.values()
-                        and list(filter(None, line.values()))
-                    ]
+                    for line in csv.DictReader(file):
+                        if None in line or None in line.values() or not list(filter(None, line.values())):
+                            continue
+
+                        if len(buffer) < buffer_size:
+                            buffer.append(line)
+                            continue
+
+                        index = random.randrange(buffer_size)
+                        chunk.append(buffer[index])
+                        buffer[index] = line
+
+                        if len(chunk) >= chunk_size:
+                            yield chunk
+                            chunk = []
             except (FileNotFoundError, PermissionError):
                 continue
 
-        random.shuffle(results)
-        return results
+        random.shuffle(buffer)
+        chunk += buffer
+
+        for index in range(0, len(chunk), chunk_size):
+            yield chunk[index:index + chunk_size]
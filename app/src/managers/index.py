@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import threading
+
+
+index_lock = threading.Lock()
+
+
+class FileIndex:
+    entries = {}
+    values = {}
+    subscribers = []
+
+    @staticmethod
+    def signature(file_path):
+        try:
+            stat = file_path.stat()
+        except (FileNotFoundError, PermissionError):
+            return None
+
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def get(file_path, loader):
+        signature = FileIndex.signature(file_path)
+        key = file_path, loader
+
+        with index_lock:
+            if (entry := FileIndex.entries.get(key)) and entry[0] == signature:
+                return entry[1]
+
+        value = loader(file_path)
+
+        with index_lock:
+            FileIndex.entries[key] = signature, value
+
+        return value
+
+    @staticmethod
+    def subscribe(callback):
+        FileIndex.subscribers.append(callback)
+
+    @staticmethod
+    def unsubscribe(callback):
+        try:
+            FileIndex.subscribers.remove(callback)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def publish(category, name, value):
+        with index_lock:
+            if FileIndex.values.get((category, name)) == value:
+                return False
+
+            FileIndex.values[category, name] = value
+
+        for callback in FileIndex.subscribers:
+            try:
+                callback(category, name, value)
+            except Exception:
+                continue
+
+        return True
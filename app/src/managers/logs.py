@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import math
 import threading
 from constants.apis import API_DOMAIN
 from constants.env import FILE_ENCODING, LOGS_PATH
@@ -13,6 +14,9 @@ file_lock = threading.Lock()
 
 
 class LogManager:
+    max_upload = 4_000_000
+    chunk_size = 65536
+
     @staticmethod
     def is_export_command(command):
         return command.lower().startswith(".export logs ")
@@ -36,43 +40,42 @@ class LogManager:
             file_path = LOGS_PATH / f"{category}.log"
 
         if file_path.exists():
-            with open(file_path, encoding=FILE_ENCODING) as file:
-                logs = file.read()
+            slice_count = max(math.ceil(file_path.stat().st_size / LogManager.max_upload), 1)
         else:
             logger.error("No logs to export")
             return
 
-        max_upload = 4_000_000
-        if len(logs) > max_upload:
-            slices = [
-                logs[x:x+max_upload]
-                for x in range(0, len(logs), max_upload)
-            ]
-        else:
-            slices = [logs]
-
         try:
-            for index, logs_slice in enumerate(slices):
-                response = http.post(
-                    f"https://{API_DOMAIN}/logs/{data.USER['id']}",
-                    body={
-                        "category": category,
-                        "logfile": (
-                            f"{index + 1}/{len(slices)} {file_path.name}" if len(slices) > 1 else file_path.name,
-                            "text/plain", logs_slice,
-                        )
-                    },
-                    headers={
-                        "content-type": "multipart/form-data",
-                        "authorization": generate_bearer()
-                    }
-                )
+            with open(file_path, "rb") as file:
+                for index in range(slice_count):
+                    response = http.POOL.post(
+                        f"https://{API_DOMAIN}/logs/{data.USER['id']}",
+                        body={
+                            "category": category,
+                            "logfile": (
+                                f"{index + 1}/{slice_count} {file_path.name}" if slice_count > 1 else file_path.name,
+                                "text/plain", LogManager.read_slice(file), "gzip"
+                            )
+                        },
+                        headers={
+                            "content-type": "multipart/form-data",
+                            "authorization": generate_bearer()
+                        }
+                    )
 
-                if response.status != 200:
-                    logger.error("Failed to export logs")
-                    break
-            else:
-                file_path.unlink()
-                logger.success("Exported logs")
+                    if response.status != 200:
+                        logger.error("Failed to export logs")
+                        break
+                else:
+                    file.close()
+                    file_path.unlink()
+                    logger.success("Exported logs")
         except HTTPError:
             logger.error("Failed to export logs")
+
+    @staticmethod
+    def read_slice(file):
+        remaining = LogManager.max_upload
+        while remaining > 0 and (chunk := file.read(min(LogManager.chunk_size, remaining))):
+            remaining -= len(chunk)
+            yield chunk
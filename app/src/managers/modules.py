@@ -24,6 +24,16 @@ class ModuleManager:
                 if not config.get("isSecret") or tool in data.USER["secretModules"]
             ]
 
+    @staticmethod
+    def get_public_modules():
+        return [
+            site for site, config in modules.SITES.items()
+            if not config.get("isSecret")
+        ], [
+            tool for tool, config in modules.TOOLS.items()
+            if not config.get("isSecret")
+        ]
+
     @staticmethod
     def get_sites():
         return [
@@ -6,6 +6,7 @@ from constants.env import FILE_ENCODING, PROXIES_PATH
 from common.utils import sleep, threaded
 from tasks.common.classes import Proxy
 from .files import FileManager
+from .index import FileIndex
 
 
 proxy_lock = threading.Lock()
@@ -34,7 +35,7 @@ class ProxyManager:
                 if ".txt" not in file_path.name:
                     continue
 
-                if line_count := FileManager.fetch_line_count(file_path):
+                if line_count := FileIndex.get(file_path, FileManager.fetch_line_count):
                     proxies.append({
                         "fileName": file_path.name,
                         "lineCount": line_count
@@ -60,11 +61,23 @@ class ProxyManager:
         random.shuffle(proxies)
         return proxies
 
+    def fetch_signatures(self):
+        return [
+            FileIndex.signature(PROXIES_PATH / file_name)
+            for file_name in self.files
+        ]
+
     @threaded
     def monitor_files(self):
+        signatures = self.fetch_signatures()
+
         while True:
             sleep(2)
 
+            if (current_signatures := self.fetch_signatures()) == signatures:
+                continue
+            signatures = current_signatures
+
             with proxy_lock:
                 if proxies := self.fetch_proxies(self.files):
                     self.all_proxies = proxies
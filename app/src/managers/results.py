@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import os
+import csv
+import queue
+import threading
+from constants.env import FILE_ENCODING
+from common.utils import current_ts
+
+
+class ResultsManager:
+    max_batch = 250
+    max_delay = 1
+
+    def __init__(self, files, fields):
+        self.files = files
+        self.fields = fields
+
+        self.queue = queue.SimpleQueue()
+        self.handles = {}
+        self.writers = {}
+        self.thread = None
+
+    @staticmethod
+    def writer(file):
+        return csv.writer(file, lineterminator="\n")
+
+    def build(self):
+        for status, file_path in self.files.items():
+            try:
+                self.handles[status] = open(file_path, "w", encoding=FILE_ENCODING, newline="")
+                self.writers[status] = self.writer(self.handles[status])
+                self.writers[status].writerow(self.fields)
+            except (FileNotFoundError, PermissionError):
+                continue
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, status, row):
+        self.queue.put((status, row))
+
+    def sync(self):
+        if self.thread:
+            event = threading.Event()
+
+            self.queue.put((None, event))
+            event.wait()
+
+    def close(self):
+        if self.thread:
+            self.queue.put((None, None))
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        batch = []
+        flush_ts = current_ts(exact=True) + self.max_delay
+
+        while True:
+            try:
+                status, row = self.queue.get(
+                    timeout=max(flush_ts - current_ts(exact=True), 0)
+                )
+            except queue.Empty:
+                status, row = None, False
+
+            if status:
+                batch.append((status, row))
+                if len(batch) < self.max_batch:
+                    continue
+
+            self.flush(batch, fsync=status is None and row is not False)
+            batch = []
+            flush_ts = current_ts(exact=True) + self.max_delay
+
+            if status is None and row is None:
+                for file in self.handles.values():
+                    file.close()
+
+                self.handles = {}
+                self.writers = {}
+                return
+            elif status is None and row:
+                row.set()
+
+    def flush(self, batch, fsync=False):
+        for status, row in batch:
+            if writer := self.writers.get(status):
+                writer.writerow(row)
+
+        for file in self.handles.values():
+            try:
+                file.flush()
+                if fsync:
+                    os.fsync(file.fileno())
+            except OSError:
+                continue
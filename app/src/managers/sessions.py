@@ -1,21 +1,72 @@
 # -*- coding: utf-8 -*-
 import json
 import threading
+from collections import OrderedDict
 from constants.env import FILE_ENCODING, SESSIONS_PATH
+from common.database import Database
+from common.errors import JSONError
+from common.utils import sleep, current_ts, threaded
 from common.ui import logger
-from tasks.common.classes import CaseInsensitiveDict
 
 
-file_lock = threading.Lock()
+DATABASE = Database(SESSIONS_PATH / "sessions.db", """
+    CREATE TABLE IF NOT EXISTS sessions (
+        module TEXT NOT NULL,
+        parent_id TEXT NOT NULL,
+        data TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        PRIMARY KEY (module, parent_id)
+    ) WITHOUT ROWID;
+""")
 
 
 class SessionsManager:
+    max_size = 5000
+    max_age = 14 * 86400
+    flush_interval = 5
+
     def __init__(self, module):
-        self.module = module
+        self.module = self.format_module(module)
+
+        self.migrate()
 
-        self.file_path = SESSIONS_PATH / f"{module.lower().replace(' ', '_').strip('.?')}.json"
-        with open(self.file_path, encoding=FILE_ENCODING) as file:
-            self.sessions = CaseInsensitiveDict(json.load(file))
+        self.cache = OrderedDict()
+        self.dirty = {}
+        self.lock = threading.Lock()
+
+        self.is_open = True
+        self.flush_on_interval()
+
+    @staticmethod
+    def format_module(module):
+        return module.lower().replace(" ", "_").strip(".?")
+
+    @staticmethod
+    def migrate():
+        for file_path in SESSIONS_PATH.glob("*.json"):
+            try:
+                with open(file_path, encoding=FILE_ENCODING) as file:
+                    content = json.load(file)
+            except (FileNotFoundError, PermissionError, JSONError):
+                continue
+
+            DATABASE.execute_many(
+                "INSERT OR IGNORE INTO sessions VALUES (?, ?, ?, ?)", [
+                    (file_path.stem, parent_id.lower(), json.dumps(data), current_ts())
+                    for parent_id, data in content.items()
+                ]
+            )
+
+            file_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def prune():
+        SessionsManager.migrate()
+
+        DATABASE.execute(
+            "DELETE FROM sessions WHERE timestamp < ?",
+            (current_ts() - SessionsManager.max_age,)
+        )
 
     @staticmethod
     def is_clear_command(command):
@@ -23,27 +74,71 @@ class SessionsManager:
 
     @staticmethod
     def clear(command):
-        file_path = SESSIONS_PATH / f"{command.split()[2].lower().strip('.?')}.json"
-
-        if file_path.exists():
-            with open(file_path, "w", encoding=FILE_ENCODING) as file:
-                file.write("{}")
+        SessionsManager.migrate()
 
+        if DATABASE.execute("DELETE FROM sessions WHERE module = ?", (command.split()[2].lower().strip(".?"),)):
             logger.success("Cleared sessions")
         else:
             logger.error("No sessions to clear")
 
+    @threaded
+    def flush_on_interval(self):
+        while self.is_open:
+            sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            dirty, self.dirty = self.dirty, {}
+
+        if dirty:
+            DATABASE.execute_many(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)", [
+                    (self.module, parent_id, json.dumps(data), timestamp)
+                    for parent_id, (data, timestamp) in dirty.items()
+                ]
+            )
+
+    def close(self):
+        self.is_open = False
+        self.flush()
+
+    def cache_session(self, parent_id, data, timestamp):
+        self.cache[parent_id] = data, timestamp
+        self.cache.move_to_end(parent_id)
+
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
     def get(self, parent):
-        return self.sessions.get(parent.id)
+        parent_id = parent.id.lower()
 
-    def save(self, parent, data):
-        with file_lock:
-            with open(self.file_path, encoding=FILE_ENCODING) as file:
-                content = CaseInsensitiveDict(json.load(file))
+        with self.lock:
+            session = self.cache.get(parent_id) or self.dirty.get(parent_id)
 
-            content[parent.id] = data
+        if not session:
+            rows = DATABASE.fetch_all(
+                "SELECT data, timestamp FROM sessions WHERE module = ? AND parent_id = ?",
+                (self.module, parent_id)
+            )
+            if not rows:
+                return None
+
+            session = json.loads(rows[0][0]), rows[0][1]
+
+        data, timestamp = session
+        if current_ts() - timestamp > self.max_age:
+            return None
+
+        with self.lock:
+            self.cache_session(parent_id, data, timestamp)
+
+        return data
+
+    def save(self, parent, data):
+        parent_id = parent.id.lower()
+        timestamp = current_ts()
 
-            with open(self.file_path, "w", encoding=FILE_ENCODING) as file:
-                file.write(json.dumps(
-                    content, indent=4
-                ))
+        with self.lock:
+            self.cache_session(parent_id, data, timestamp)
+            self.dirty[parent_id] = data, timestamp
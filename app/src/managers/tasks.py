@@ -2,21 +2,25 @@
 import threading
 import traceback
 import random
+import csv
+from itertools import count
 from constants import app, colors, modules
 from constants.env import FILE_ENCODING, ILLEGAL_FILE_CHARS, RESULTS_PATH, SITES_PATH, TOOLS_PATH
+from common import bridge, data, http
 from common.errors import FileError, TaskError
-from common.utils import sleep, current_datetime, joins, hide_file, get_average_length, threaded
-from common.ui import logger, set_console_title
+from common.utils import sleep, current_datetime, joins, hide_file, threaded
+from common.ui import logger, set_console_title, TitleRenderer
 from tasks.common.classes import Task, Input, SizeRange
-from . import AnalyticsManager, FileManager, EntriesManager, LogManager, ProxyManager, SessionsManager
+from tasks.common import logger as task_logger
+from . import AnalyticsManager, FileManager, EntriesManager, LogManager, ProxyManager, ResultsManager, SessionsManager
+from .dispatch import TaskQueue
 
 
-task_lock = threading.Lock()
-file_lock = threading.Lock()
 stats_lock = threading.Lock()
 
 
 class TaskManager:
+    ffi_workers = 64
     parent_fields = [
         "profiles", "tasks"
     ]
@@ -32,8 +36,9 @@ class TaskManager:
         self.config = modules.MODULES[module]["submodules"][submodule]
         self.is_site = module in modules.SITE_LIST
 
-        self.module_cls = self.config["module"]
+        self.module_cls = self.config["module"].resolve()
         self.thread_amount, self.thread_delay_range = concurrency
+        self.engine = data.SETTINGS.get("task-engine", "threads").lower()
 
         if any(key in user_input for key in self.parent_fields):
             key = next(
@@ -41,28 +46,12 @@ class TaskManager:
                 if key in user_input
             )
 
-            try:
-                self.parents = [
-                    self.config["parent"](
-                        **{
-                            "data": {
-                                key.replace("*", ""): value.strip()
-                                for key, value in parent.items()
-                            }
-                        } if "data" in self.config["parent"].fields() else {
-                            key.lower().replace(" ", "_"): value.strip()
-                            for key, value in parent.items()
-                            if key.lower().replace(" ", "_") in self.config["parent"].fields(include_optional=True)
-                        },
-                        ctx={"module": module}
-                    ) for parent in FileManager.fetch_csv_files(
-                        (SITES_PATH if self.is_site else TOOLS_PATH) / module.translate(ILLEGAL_FILE_CHARS)
-                        / (user_input["form"]["dirName"] if user_input.get("form") else ""),
-                        user_input[key]
-                    )
-                ]
-            except TypeError:
-                self.parents = []
+            self.parent_source = self.load_parents(
+                (SITES_PATH if self.is_site else TOOLS_PATH) / module.translate(ILLEGAL_FILE_CHARS)
+                / (user_input["form"]["dirName"] if user_input.get("form") else ""),
+                user_input[key]
+            )
+            self.parents = next(self.parent_source, [])
 
             if not self.parents:
                 raise TaskError(f"No valid {key} found")
@@ -71,6 +60,7 @@ class TaskManager:
                 user_input[key][0] + (", ..." if len(user_input[key]) > 1 else "")
             )
         else:
+            self.parent_source = None
             self.parents = None
             self.parents_title = None
 
@@ -116,28 +106,31 @@ class TaskManager:
         else:
             self.hook = None
 
-        if self.config["subject"] in ["entries", "wins"]:
-            self.analytics = AnalyticsManager(
-                module, self.config["subject"]
-            )
-        else:
-            self.analytics = None
-
         if self.config["subject"] == "entries":
             self.entries = EntriesManager(
                 module, self.input.raffle.get("url") or self.input.raffle.get("id")
             )
 
             self.parents = self.entries.filter(self.parents)
+            while not self.parents and (parents := next(self.parent_source, None)):
+                self.parents = self.entries.filter(parents)
+
             if not self.parents:
                 raise TaskError("Tasks are already entered")
         else:
             self.entries = None
 
+        if self.config["subject"] in ["entries", "wins"]:
+            self.analytics = AnalyticsManager(
+                module, self.config["subject"]
+            )
+        else:
+            self.analytics = None
+
         self.sessions = SessionsManager(module)
 
         if self.parents:
-            self.tasks = [
+            tasks = [
                 Task(
                     id=self.format_task_id(index + 1),
                     manager=self,
@@ -147,7 +140,7 @@ class TaskManager:
                 ) for index, parent in enumerate(self.parents)
             ]
         elif module == "Google Forms" and submodule == "Scrape form":
-            self.tasks = [
+            tasks = [
                 Task(
                     id=self.format_task_id(1),
                     manager=self,
@@ -156,7 +149,7 @@ class TaskManager:
                 )
             ]
         elif module == "Geocoding":
-            self.tasks = [
+            tasks = [
                 Task(
                     id=self.format_task_id(1),
                     manager=self,
@@ -168,7 +161,7 @@ class TaskManager:
                 )
             ]
         else:
-            self.tasks = []
+            tasks = []
 
         self.results_path = (
             (SITES_PATH if self.is_site else TOOLS_PATH) / module.translate(ILLEGAL_FILE_CHARS) /
@@ -188,36 +181,75 @@ class TaskManager:
             self.results_files = {}
             self.results_fields = []
 
+        self.results = ResultsManager(
+            self.results_files, self.results_fields
+        )
+
         self.stats = {
             key: (
                 0 if key != "pending" else
                 self.input.amount if module in ["Geocoding", "iCloud"] else
-                len(self.tasks)
+                len(tasks)
             ) for key in self.config["statuses"]
         }
 
-        if self.config["parent"]:
-            self.avg_parent_length = get_average_length(
-                self.tasks, lambda x: x.parent.id
-            )
-        else:
-            self.avg_parent_length = None
+        self.parent_id_length = 0
+        self.parent_count = 0
+        self.avg_parent_length = None
+        self.measure_parents(tasks)
+
+        self.title = TitleRenderer(self.format_console_title)
 
-        self.index = 0
+        self.queue = TaskQueue(tasks)
+        self.task_ids = count(len(tasks) + 1)
         self.threads = []
         self.failed = []
         self.is_initial = True
 
+    def load_parents(self, path, files):
+        for rows in FileManager.stream_csv_files(path, files):
+            parents = []
+            for row in rows:
+                try:
+                    parents.append(self.config["parent"](
+                        **{
+                            "data": {
+                                key.replace("*", ""): value.strip()
+                                for key, value in row.items()
+                            }
+                        } if "data" in self.config["parent"].fields() else {
+                            key.lower().replace(" ", "_"): value.strip()
+                            for key, value in row.items()
+                            if key.lower().replace(" ", "_") in self.config["parent"].fields(include_optional=True)
+                        },
+                        ctx={"module": self.module}
+                    ))
+                except TypeError:
+                    continue
+
+            if parents:
+                yield parents
+
+    @threaded
+    def stream_parents(self):
+        try:
+            for parents in self.parent_source:
+                if self.entries:
+                    parents = self.entries.filter(parents)
+
+                for parent in parents:
+                    self.add_task(parent)
+        finally:
+            self.queue.close()
+
     def __iter__(self):
         return self
 
     def __next__(self):
-        with task_lock:
-            self.index += 1
-            try:
-                return self.tasks[self.index - 1]
-            except IndexError:
-                raise StopIteration
+        if task := self.queue.get():
+            return task
+        else:
+            raise StopIteration
 
     @staticmethod
     def print_seperator():
@@ -241,42 +273,63 @@ class TaskManager:
         else:
             return random.randrange(*self.thread_delay_range)
 
-    def refresh_vars(self):
-        self.sessions = SessionsManager(self.module)
+    def measure_parents(self, tasks):
+        if not self.config["parent"]:
+            return
+
+        with stats_lock:
+            self.parent_id_length += sum(len(task.parent.id) for task in tasks)
+            self.parent_count += len(tasks)
+
+            self.avg_parent_length = (
+                self.parent_id_length // self.parent_count
+                if self.parent_count else 0
+            )
+
+    def refresh_vars(self, tasks=None):
+        self.sessions.flush()
+
+        if tasks is not None:
+            self.queue = TaskQueue(tasks)
 
         self.stats = {
             key: (
                 0 if key != "pending" else
                 self.input.amount if self.module in ["Geocoding", "iCloud"] else
-                len(self.tasks)
+                len(self.queue)
             ) for key in self.config["statuses"]
         }
 
-        if self.config["parent"]:
-            self.avg_parent_length = get_average_length(
-                self.tasks, lambda x: x.parent.id
-            )
-        else:
-            self.avg_parent_length = None
+        self.parent_id_length = 0
+        self.parent_count = 0
+        self.measure_parents(self.queue.tasks)
 
-        self.index = 0
         self.failed = []
 
+    @property
+    def pending_count(self):
+        return len(self.queue)
+
     def add_task(self, parent, **kwargs):
-        with task_lock:
-            self.tasks.append(
-                Task(
-                    id=self.format_task_id(len(self.tasks) + 1),
-                    manager=self,
-                    parent=parent,
-                    proxies=self.proxy_manager,
-                    input=kwargs.get("input") or self.input
-                )
-            )
+        task = Task(
+            id=self.format_task_id(next(self.task_ids)),
+            manager=self,
+            parent=parent,
+            proxies=self.proxy_manager,
+            input=kwargs.get("input") or self.input
+        )
+
+        self.measure_parents([task])
+        with stats_lock:
+            self.stats["pending"] += 1
+
+        self.queue.put(task)
+        self.title.update()
 
     def launcher(self):
         for index, task in enumerate(self):
             if self.thread_amount == 1 and index > 0:
+                task_logger.Logger.flush()
                 print()
                 if delay := self.calculate_delay():
                     logger.log(f"Waiting {delay} second{'s' if delay != 1 else ''}...", colors.GREY)
@@ -296,6 +349,7 @@ class TaskManager:
         self.set_console_title()
 
         if self.is_initial:
+            http.METRICS.reset()
             self.build_files()
 
             if self.hook:
@@ -306,11 +360,23 @@ class TaskManager:
                 else:
                     return
 
-        self.threads = [
-            threading.Thread(target=self.launcher)
-            for _ in range(self.thread_amount)
-        ]
+            if self.parent_source:
+                self.queue.open()
+                self.stream_parents()
+
+        if self.engine == "asyncio":
+            self.threads = [
+                threading.Thread(target=bridge.run, args=(
+                    self.launcher, self.thread_amount, min(self.thread_amount, self.ffi_workers)
+                ))
+            ]
+        else:
+            self.threads = [
+                threading.Thread(target=self.launcher)
+                for _ in range(self.thread_amount)
+            ]
 
+        self.title.start()
         for thread in self.threads:
             thread.start()
 
@@ -318,15 +384,22 @@ class TaskManager:
         for thread in self.threads:
             thread.join()
 
+        self.title.stop()
+        task_logger.Logger.flush()
+        self.results.sync()
+
     @threaded
     def finish(self):
+        self.results.close()
+        self.sessions.close()
+
+        http.METRICS.dump(self.results_path / "metrics.json")
+
         if self.analytics:
-            self.analytics.export()
+            self.analytics.finish()
 
     def rerun_failed(self):
-        self.tasks = self.failed.copy()
-
-        self.refresh_vars()
+        self.refresh_vars(self.failed)
         self.is_initial = False
 
         self.start()
@@ -335,42 +408,40 @@ class TaskManager:
         try:
             if not self.results_path.is_dir():
                 self.results_path.mkdir()
-
-            for file_path in self.results_files.values():
-                with open(file_path, "w", encoding=FILE_ENCODING) as file:
-                    file.write(",".join(self.results_fields) + "\n")
         except (FileNotFoundError, PermissionError):
-            pass
+            return
 
-    def set_console_title(self):
-        set_console_title(
-            app.NAME + "  •  " + joins(
-                self.module, self.parents_title, self.proxies_title,
-                " - ".join(f"{key.replace('_', ' ').capitalize()}: {value}" for key, value in self.stats.items()) or None,
-                sep="  |  "
-            )
+        self.results.build()
+
+    def format_console_title(self):
+        with stats_lock:
+            stats = self.stats.copy()
+
+        return app.NAME + "  •  " + joins(
+            self.module, self.parents_title, self.proxies_title,
+            " - ".join(f"{key.replace('_', ' ').capitalize()}: {value}" for key, value in stats.items()) or None,
+            sep="  |  "
         )
 
+    def set_console_title(self):
+        set_console_title(self.format_console_title())
+
     def write_result(self, status, **kwargs):
-        with file_lock:
-            try:
-                with open(self.results_files[status], "a", encoding=FILE_ENCODING) as file:
-                    file.write(joins(
-                        kwargs["location"] if "Location" in self.results_fields else None,
-                        kwargs["product"].name if "Product" in self.results_fields else None,
-                        kwargs["product"].size if "Size" in self.results_fields else None,
-                        kwargs["raffle"] if "Raffle" in self.results_fields else None,
-                        kwargs["message"].sender if "Sender" in self.results_fields else None,
-                        kwargs["message"].text if "Message" in self.results_fields else None,
-                        *(
-                            kwargs["parent"].values() if isinstance(kwargs["parent"], dict) else
-                            kwargs["parent"].json().values()
-                        ),
-                        kwargs["proxy"].line if "Proxy" in self.results_fields else None,
-                        sep=",", modifier=lambda x: f'"{x}"' if "," in x else x
-                    ) + "\n")
-            except (FileNotFoundError, PermissionError):
-                pass
+        self.results.write(status, [
+            value for value in (
+                kwargs["location"] if "Location" in self.results_fields else None,
+                kwargs["product"].name if "Product" in self.results_fields else None,
+                kwargs["product"].size if "Size" in self.results_fields else None,
+                kwargs["raffle"] if "Raffle" in self.results_fields else None,
+                kwargs["message"].sender if "Sender" in self.results_fields else None,
+                kwargs["message"].text if "Message" in self.results_fields else None,
+                *(
+                    kwargs["parent"].values() if isinstance(kwargs["parent"], dict) else
+                    kwargs["parent"].json().values()
+                ),
+                kwargs["proxy"].line if "Proxy" in self.results_fields else None
+            ) if value is not None
+        ])
 
     def write_custom_result(self, files, files_to_hide=None):
         try:
@@ -379,18 +450,11 @@ class TaskManager:
 
                 path.mkdir()
                 for file_name, content in files.items():
-                    with open(path / file_name, "w", encoding=FILE_ENCODING) as file:
+                    with open(path / file_name, "w", encoding=FILE_ENCODING, newline="") as file:
                         if ".csv" in file_name:
-                            file.write("\n".join((
-                                joins(
-                                    *content.keys(),
-                                    sep=",", modifier=lambda x: f'"{x}"' if "," in x else x
-                                ),
-                                joins(
-                                    *content.values(),
-                                    sep=",", modifier=lambda x: f'"{x}"' if "," in x else x
-                                )
-                            )))
+                            csv.writer(file, lineterminator="\n").writerows((
+                                content.keys(), content.values()
+                            ))
                         else:
                             file.write(content)
 
@@ -409,7 +473,7 @@ class TaskManager:
             if status == "failed":
                 self.failed.append(kwargs["task"])
 
-        self.set_console_title()
+        self.title.update()
         if write_result and not (status == "failed" and not self.is_initial):
             self.write_result(status, **kwargs)
 
@@ -1,2 +1,21 @@
 # -*- coding: utf-8 -*-
-from . import common, hooks, modules
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from . import common, hooks, modules
+
+
+__all__ = [
+    "common",
+    "hooks",
+    "modules"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,22 @@
 # -*- coding: utf-8 -*-
+import importlib
 from .logger import Logger
-from .browser import Browser
-from . import classes, errors, webhooks
+
+
+__all__ = [
+    "Logger",
+    "Browser",
+    "classes",
+    "errors",
+    "webhooks"
+]
+
+
+def __getattr__(name):
+    if name == "Browser":
+        from .browser import Browser
+        return Browser
+    elif name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,7 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from urllib.parse import urlencode
 from constants.env import OS, DEPS_PATH
+from common import bridge
 from common.utils import sleep, threaded, generate_temp_path
 from common.http.constants import ACCEPT_LANGUAGE
 
@@ -43,6 +44,11 @@ class Browser(webdriver.Chrome):
             options=options
         )
 
+    def execute(self, driver_command, params=None):
+        return bridge.call(
+            super().execute, driver_command, params
+        )
+
     @threaded
     def close(self):
         self.quit()
@@ -2,12 +2,12 @@
 from __future__ import annotations
 import random
 import string
+import importlib
 import managers
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from common import http
+from common import data, http
 from common.utils import xxx_jig
-from common.data import COUNTRY_IDS, COUNTRY_DATA, PHONE_DATA, FIRST_NAMES, LAST_NAMES
 from . import logger
 
 
@@ -61,12 +61,12 @@ class Profile:
             self.gender = "female"
 
         if self.first_name.lower().replace(" ", "") in ["random", "ran", "any", "jig"]:
-            self.first_name, self.gender = random.choice(FIRST_NAMES)
+            self.first_name, self.gender = random.choice(data.FIRST_NAMES)
         elif "XXX" in self.first_name or "xxx" in self.first_name:
             self.first_name = xxx_jig(self.first_name)
 
         if self.last_name.lower().replace(" ", "") in ["random", "ran", "any", "jig"]:
-            self.last_name = random.choice(LAST_NAMES)
+            self.last_name = random.choice(data.LAST_NAMES)
         elif "XXX" in self.last_name or "xxx" in self.last_name:
             self.last_name = xxx_jig(self.last_name)
 
@@ -101,7 +101,7 @@ class Profile:
 
         if self.phone_number.lower().replace(" ", "") in ["random", "ran", "any", "jig"]:
             try:
-                length = PHONE_DATA[self.phone_prefix[1:]]["length"]
+                length = data.PHONE_DATA[self.phone_prefix[1:]]["length"]
             except KeyError:
                 length = 10
 
@@ -129,7 +129,7 @@ class Profile:
         self.country = self.country.upper().replace(".", "")
         if not len(self.country) == 2:
             try:
-                self.country = COUNTRY_IDS[
+                self.country = data.COUNTRY_IDS[
                     self.country.lower().replace(" ", "").replace("-", "").replace("'", "")
                 ]
             except KeyError:
@@ -202,7 +202,7 @@ class Profile:
     @property
     def country_name(self):
         try:
-            return COUNTRY_DATA[self.country]["name"]
+            return data.COUNTRY_DATA[self.country]["name"]
         except KeyError:
             return self.country
 
@@ -502,3 +502,23 @@ class CaseInsensitiveDict(dict):
             key.lower(): value
             for key, value in dictionary.items()
         })
+
+
+class LazyClass:
+    def __init__(self, package, module, name):
+        self.package = package
+        self.module = module
+        self.name = name
+
+        self.cls = None
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def resolve(self):
+        if not self.cls:
+            self.cls = getattr(
+                importlib.import_module(f".{self.module}", self.package), self.name
+            )
+
+        return self.cls
@@ -1,15 +1,22 @@
 # -*- coding: utf-8 -*-
+import queue
 import threading
 from constants import colors
 from constants.env import FILE_ENCODING, LOGS_PATH
 from common.utils import current_date, current_datetime, joins
 
 
-file_lock = threading.Lock()
-print_lock = threading.Lock()
+sink_lock = threading.Lock()
+dropped_lock = threading.Lock()
 
 
 class Logger:
+    log_queue = queue.Queue(maxsize=50_000)
+    max_batch = 1000
+
+    sink = None
+    dropped = 0
+
     def __init__(self, module, task_id, parent_id=None):
         self.module = module
         self.task_id = task_id
@@ -17,28 +24,91 @@ class Logger:
 
         self.file_path = LOGS_PATH / f"{module.lower().replace(' ', '_').strip('.?')}-{current_date()}.log"
 
+    @classmethod
+    def start_sink(cls):
+        with sink_lock:
+            if not cls.sink:
+                cls.sink = threading.Thread(target=cls.run_sink, daemon=True)
+                cls.sink.start()
+
+    @classmethod
+    def run_sink(cls):
+        while True:
+            batch = [cls.log_queue.get()]
+            while len(batch) < cls.max_batch:
+                try:
+                    batch.append(cls.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                cls.write_batch(batch)
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    cls.log_queue.task_done()
+
+    @classmethod
+    def write_batch(cls, batch):
+        lines = [line for line, _, _ in batch]
+        with dropped_lock:
+            dropped, cls.dropped = cls.dropped, 0
+
+        if dropped:
+            lines.append(f" %s{dropped} log lines dropped%s" % colors.GREY)
+
+        try:
+            print("\n".join(lines))
+        except (OSError, UnicodeError):
+            for line in lines:
+                try:
+                    print(line)
+                except (OSError, UnicodeError):
+                    continue
+
+        files = {}
+        for _, file_path, entry in batch:
+            files.setdefault(file_path, []).append(entry)
+
+        for file_path, entries in files.items():
+            try:
+                with open(file_path, "a", encoding=FILE_ENCODING) as file:
+                    file.write("".join(entries))
+            except (OSError, UnicodeError):
+                continue
+
+    @classmethod
+    def flush(cls):
+        if cls.sink:
+            cls.log_queue.join()
+
     def log(self, status, msg, color):
         if isinstance(msg, tuple):
             msg, details = msg
         else:
             details = None
 
-        with print_lock:
-            datetime = current_datetime()
+        datetime = current_datetime()
 
-            print(joins(
-                f" %s{datetime}%s" % colors.DARK_GREY, self.task_id, self.parent_id,
-                f"%s{msg}%s" % color, f"%s{details}%s" % colors.GREY if details else None,
-                sep=" %s|%s " % colors.GREY
-            ))
+        if not self.sink:
+            self.start_sink()
 
-        with file_lock:
-            with open(self.file_path, "a", encoding=FILE_ENCODING) as file:
-                file.write(
-                    f"[{status}]".ljust(10) + joins(
-                        datetime, self.task_id, self.parent_id, msg, details, sep=" | "
-                    ) + "\n"
-                )
+        try:
+            self.log_queue.put_nowait((
+                joins(
+                    f" %s{datetime}%s" % colors.DARK_GREY, self.task_id, self.parent_id,
+                    f"%s{msg}%s" % color, f"%s{details}%s" % colors.GREY if details else None,
+                    sep=" %s|%s " % colors.GREY
+                ),
+                self.file_path,
+                f"[{status}]".ljust(10) + joins(
+                    datetime, self.task_id, self.parent_id, msg, details, sep=" | "
+                ) + "\n"
+            ))
+        except queue.Full:
+            with dropped_lock:
+                Logger.dropped += 1
 
     def info(self, msg):
         self.log("INFO", msg, colors.WHITE)
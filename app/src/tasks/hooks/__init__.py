@@ -1,11 +1,35 @@
 # -*- coding: utf-8 -*-
-from . import (
-    captcha,
-    cloudflare,
-    pow_challenge,
-    adyen,
-    akamai_bmp,
-    discord_webhook,
-    id_numbers,
-    imap
-)
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from . import (
+        captcha,
+        cloudflare,
+        pow_challenge,
+        adyen,
+        akamai_bmp,
+        discord_webhook,
+        id_numbers,
+        imap
+    )
+
+
+__all__ = [
+    "captcha",
+    "cloudflare",
+    "pow_challenge",
+    "adyen",
+    "akamai_bmp",
+    "discord_webhook",
+    "id_numbers",
+    "imap"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
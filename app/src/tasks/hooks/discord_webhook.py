@@ -6,7 +6,7 @@ from tasks.common.errors import HTTPError
 
 
 class Webhook:
-    session = http.Session()
+    session = http.PoolSession()
 
     def __init__(self, url, **kwargs):
         self.url = url
@@ -45,7 +45,8 @@ class Webhook:
                 body=self.json(),
                 headers={
                     "content-type": "application/json"
-                }
+                },
+                discard_response=True
             )
         except HTTPError:
             pass
@@ -1,2 +1,20 @@
 # -*- coding: utf-8 -*-
-from . import sites, tools
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from . import sites, tools
+
+
+__all__ = [
+    "sites",
+    "tools"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,59 @@
 # -*- coding: utf-8 -*-
-from . import (
-    adidas_confirmed,
-    afew,
-    baseline,
-    bstn,
-    elementos,
-    empire_skate,
-    fenom,
-    footpatrol,
-    footshop,
-    impact_premium,
-    instagram,
-    jd_sports,
-    kickz,
-    kith_eu,
-    naked,
-    segons,
-    shelflife,
-    size,
-    the_hip_store,
-    tops_and_bottoms
-)
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from . import (
+        adidas_confirmed,
+        afew,
+        baseline,
+        bstn,
+        elementos,
+        empire_skate,
+        fenom,
+        footpatrol,
+        footshop,
+        impact_premium,
+        instagram,
+        jd_sports,
+        kickz,
+        kith_eu,
+        naked,
+        segons,
+        shelflife,
+        size,
+        the_hip_store,
+        tops_and_bottoms
+    )
+
+
+__all__ = [
+    "adidas_confirmed",
+    "afew",
+    "baseline",
+    "bstn",
+    "elementos",
+    "empire_skate",
+    "fenom",
+    "footpatrol",
+    "footshop",
+    "impact_premium",
+    "instagram",
+    "jd_sports",
+    "kickz",
+    "kith_eu",
+    "naked",
+    "segons",
+    "shelflife",
+    "size",
+    "the_hip_store",
+    "tops_and_bottoms"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
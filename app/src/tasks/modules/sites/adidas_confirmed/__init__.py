@@ -1,16 +1,20 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Profile
+from tasks.common.classes import Profile, LazyClass
 from .constants import NAME
-from .enter_raffle import EnterRaffle
-from .check_orders import CheckOrders
-from .generate_account import GenerateAccount
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
+    from .check_orders import CheckOrders
+    from .generate_account import GenerateAccount
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -19,7 +23,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Check orders": {
-        "module": CheckOrders,
+        "module": LazyClass(__name__, "check_orders", "CheckOrders"),
         "parent": Profile,
         "subject": "wins",
         "input": ["expiredRaffle", "profiles", "proxies"],
@@ -28,7 +32,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Generate accounts": {
-        "module": GenerateAccount,
+        "module": LazyClass(__name__, "generate_account", "GenerateAccount"),
         "parent": Profile,
         "subject": "accounts",
         "input": ["profiles", "proxies"],
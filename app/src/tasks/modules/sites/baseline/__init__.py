@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Profile
+from tasks.common.classes import Profile, LazyClass
 from .constants import NAME, RAFFLE_DOMAIN
-from .enter_raffle import EnterRaffle
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Profile, Email
+from tasks.common.classes import Profile, Email, LazyClass
 from .constants import NAME, RAFFLE_DOMAIN
-from .enter_raffle import EnterRaffle
-from .check_raffle_result import CheckRaffleResult
-from .generate_account import GenerateAccount
-from .verify_account import VerifyAccount
-from .fetch_emails import FetchEmails
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
+    from .check_raffle_result import CheckRaffleResult
+    from .generate_account import GenerateAccount
+    from .verify_account import VerifyAccount
+    from .fetch_emails import FetchEmails
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -21,7 +25,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Check raffle results": {
-        "module": CheckRaffleResult,
+        "module": LazyClass(__name__, "check_raffle_result", "CheckRaffleResult"),
         "parent": Profile,
         "subject": "wins",
         "input": ["expiredRaffle", "profiles", "proxies"],
@@ -30,7 +34,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Generate accounts": {
-        "module": GenerateAccount,
+        "module": LazyClass(__name__, "generate_account", "GenerateAccount"),
         "parent": Profile,
         "subject": "accounts",
         "input": ["profiles", "proxies"],
@@ -39,9 +43,9 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Verify accounts": {
-        "module": VerifyAccount,
+        "module": LazyClass(__name__, "verify_account", "VerifyAccount"),
         "parent": Email,
-        "hook": FetchEmails,
+        "hook": LazyClass(__name__, "fetch_emails", "FetchEmails"),
         "subject": "verification",
         "input": ["maxEmailAge", "proxies"],
         "output": [*Email.fields(), "proxy"],
@@ -1,16 +1,20 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Profile, Email
+from tasks.common.classes import Profile, Email, LazyClass
 from .constants import NAME, DOMAIN
-from .enter_raffle import EnterRaffle
-from .verify_entry import VerifyEntry
-from .fetch_emails import FetchEmails
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
+    from .verify_entry import VerifyEntry
+    from .fetch_emails import FetchEmails
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -19,9 +23,9 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Verify entries": {
-        "module": VerifyEntry,
+        "module": LazyClass(__name__, "verify_entry", "VerifyEntry"),
         "parent": Email,
-        "hook": FetchEmails,
+        "hook": LazyClass(__name__, "fetch_emails", "FetchEmails"),
         "subject": "verification",
         "input": ["maxEmailAge", "proxies"],
         "output": [*Email.fields(), "proxy"],
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import FormProfile
+from tasks.common.classes import FormProfile, LazyClass
 from .constants import NAME, DOMAIN, SHORT_DOMAIN
-from .enter_form import EnterForm
-from .scrape_form import ScrapeForm
+
+
+if TYPE_CHECKING:
+    from .enter_form import EnterForm
+    from .scrape_form import ScrapeForm
 
 
 SUBMODULES = {
     "Enter form": {
-        "module": EnterForm,
+        "module": LazyClass(__name__, "enter_form", "EnterForm"),
         "parent": FormProfile,
         "subject": "formEntries",
         "input": ["form", "profiles", "proxies"],
@@ -18,7 +22,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Scrape form": {
-        "module": ScrapeForm,
+        "module": LazyClass(__name__, "scrape_form", "ScrapeForm"),
         "parent": None,
         "subject": "formScraping",
         "input": ["activeRaffle"],
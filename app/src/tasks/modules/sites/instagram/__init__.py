@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Instagram
+from tasks.common.classes import Instagram, LazyClass
 from .constants import NAME, POST_DOMAIN
-from .enter_raffle import EnterRaffle
-from .check_inbox import CheckInbox
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
+    from .check_inbox import CheckInbox
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Instagram,
         "subject": "entries",
         "input": ["activeRaffle", "tasks", "proxies"],
@@ -18,7 +22,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Check inbox": {
-        "module": CheckInbox,
+        "module": LazyClass(__name__, "check_inbox", "CheckInbox"),
         "parent": Instagram,
         "subject": "wins",
         "input": ["instagramAccount", "tasks", "proxies"],
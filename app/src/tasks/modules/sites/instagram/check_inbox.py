@@ -78,6 +78,7 @@ class CheckInbox:
         self.logger.info("Logging in...")
 
         if not rerun and (content := self.task.manager.sessions.get(self.task.parent)):
+            self.session.cookies.set_many(content.get("cookies", {}))
             self.data.update(content)
             self.delay()
         else:
@@ -183,7 +184,8 @@ class CheckInbox:
                 "adId": self.data["adId"],
                 "hmac": self.data["hmac"],
                 "authHeader": self.data["authHeader"],
-                "userId": self.data["userId"]
+                "userId": self.data["userId"],
+                "cookies": self.session.cookies.export()
             })
 
         self.logger.success("Successfully logged in")
@@ -74,6 +74,7 @@ class EnterRaffle:
         self.logger.info("Logging in...")
 
         if not rerun and (content := self.task.manager.sessions.get(self.task.parent)):
+            self.session.cookies.set_many(content.get("cookies", {}))
             self.data.update(content)
             self.delay()
         else:
@@ -179,7 +180,8 @@ class EnterRaffle:
                 "adId": self.data["adId"],
                 "hmac": self.data["hmac"],
                 "authHeader": self.data["authHeader"],
-                "userId": self.data["userId"]
+                "userId": self.data["userId"],
+                "cookies": self.session.cookies.export()
             })
 
         self.logger.success("Successfully logged in")
@@ -295,7 +295,8 @@ class GenerateAccount:
             "id": self.data["id"],
             "connectionId": self.data["connectionId"],
             "interactionId": self.data["interactionId"],
-            "interactionToken": self.data["interactionToken"]
+            "interactionToken": self.data["interactionToken"],
+            "cookies": self.session.cookies.export()
         })
 
         self.logger.success("Successfully generated account")
@@ -49,6 +49,7 @@ class VerifyAccount:
         self.logger.info("Verifying account...")
 
         if content := self.task.manager.sessions.get(self.task.parent):
+            self.session.cookies.set_many(content.get("cookies", {}))
             self.data.update(content)
         else:
             self.logger.error("Failed to verify account: No session found")
@@ -1,17 +1,21 @@
 # -*- coding: utf-8 -*-
 import re
+from typing import TYPE_CHECKING
 from constants import regexes
-from tasks.common.classes import Profile
+from tasks.common.classes import Profile, LazyClass
 from .constants import NAME, LOCATIONS
-from .enter_raffle import EnterRaffle
-from .enter_instore_raffle import EnterInstoreRaffle
-from .check_raffle_result import CheckRaffleResult
-from .generate_account import GenerateAccount
+
+
+if TYPE_CHECKING:
+    from .enter_raffle import EnterRaffle
+    from .enter_instore_raffle import EnterInstoreRaffle
+    from .check_raffle_result import CheckRaffleResult
+    from .generate_account import GenerateAccount
 
 
 SUBMODULES = {
     "Enter raffle": {
-        "module": EnterRaffle,
+        "module": LazyClass(__name__, "enter_raffle", "EnterRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -20,7 +24,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Enter instore raffle": {
-        "module": EnterInstoreRaffle,
+        "module": LazyClass(__name__, "enter_instore_raffle", "EnterInstoreRaffle"),
         "parent": Profile,
         "subject": "entries",
         "input": ["storeLocation", "activeRaffle", "sizeRange", "profiles", "proxies"],
@@ -29,7 +33,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Check raffle results": {
-        "module": CheckRaffleResult,
+        "module": LazyClass(__name__, "check_raffle_result", "CheckRaffleResult"),
         "parent": Profile,
         "subject": "wins",
         "input": ["expiredRaffle", "profiles", "proxies"],
@@ -38,7 +42,7 @@ SUBMODULES = {
         "isMultiThreaded": True
     },
     "Generate accounts": {
-        "module": GenerateAccount,
+        "module": LazyClass(__name__, "generate_account", "GenerateAccount"),
         "parent": Profile,
         "subject": "accounts",
         "input": ["profiles", "proxies"],
@@ -1,5 +1,20 @@
 # -*- coding: utf-8 -*-
-from . import (
-    geocoding,
-    icloud
-)
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from . import geocoding, icloud
+
+
+__all__ = [
+    "geocoding",
+    "icloud"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
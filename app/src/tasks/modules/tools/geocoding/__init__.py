@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
-from tasks.common.classes import GeoSeed
+from typing import TYPE_CHECKING
+from tasks.common.classes import GeoSeed, LazyClass
 from .constants import NAME
-from .generate_addresses import GenerateAddresses
+
+
+if TYPE_CHECKING:
+    from .generate_addresses import GenerateAddresses
 
 
 SUBMODULES = {
     "Generate addresses": {
-        "module": GenerateAddresses,
+        "module": LazyClass(__name__, "generate_addresses", "GenerateAddresses"),
         "parent": GeoSeed,
         "subject": "addresses",
         "input": ["geoSeed", "addressAmount"],
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
-from tasks.common.classes import Email
+from typing import TYPE_CHECKING
+from tasks.common.classes import Email, LazyClass
 from .constants import NAME
-from .generate_emails import GenerateEmails
-from .get_session import GetSession
+
+
+if TYPE_CHECKING:
+    from .generate_emails import GenerateEmails
+    from .get_session import GetSession
 
 
 SUBMODULES = {
     "Generate emails": {
-        "module": GenerateEmails,
+        "module": LazyClass(__name__, "generate_emails", "GenerateEmails"),
         "parent": Email,
-        "hook": GetSession,
+        "hook": LazyClass(__name__, "get_session", "GetSession"),
         "subject": "emails",
         "input": ["emailAmount"],
         "output": ["master", "email"],
@@ -17,10 +17,9 @@ class GenerateEmails:
         self.task = task
 
         self.session = http.Session()
-        for name, value in task.input.cookies.items():
-            self.session.cookies.set(
-                name, value, HME_DOMAIN
-            )
+        self.session.cookies.set_many(
+            task.input.cookies, HME_DOMAIN
+        )
 
         self.params = {
             "clientBuildNumber": "2304Project37",